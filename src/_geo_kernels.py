@@ -0,0 +1,57 @@
+"""
+Numba-compiled kernels for geographic filtering.
+Importing this module requires numba; geo_filter falls back to NumPy/math
+implementations when it is not installed.
+"""
+import math
+import numpy as np
+from numba import njit
+from src.utils import EARTH_RADIUS_KM, EARTH_RADIUS_KM_SQ
+
+TWO_PI = 2 * math.pi
+
+
+# Explicit signature: compiled at import, and int arguments are converted
+# instead of triggering a fresh specialization
+@njit('float64(float64, float64, float64, float64)', cache=True, fastmath=True)
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Haversine distance in kilometers between two points in degrees."""
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    dlat = lat2 - lat1
+    dlon = math.radians(lon2) - math.radians(lon1)
+
+    sin_dlat = math.sin(dlat * 0.5)
+    sin_dlon = math.sin(dlon * 0.5)
+    a = (sin_dlat * sin_dlat +
+         math.cos(lat1) * math.cos(lat2) * sin_dlon * sin_dlon)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# No fastmath here: missing positions arrive as NaN and must compare False
+@njit(cache=True)
+def overhead_kernel(lats, lons, alts_ft, lat0_rad, lon0_rad, cos_lat0,
+                    radius_km_sq, min_alt_ft, max_alt_ft):
+    """Return (mask, squared distances) for aircraft inside the overhead zone."""
+    n = lats.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    distances_sq = np.empty(n, dtype=lats.dtype)
+
+    for i in range(n):
+        lat = lats[i]
+        lon = lons[i]
+        alt = alts_ft[i]
+        if lat != lat or lon != lon or alt != alt:
+            distances_sq[i] = np.nan
+            continue
+
+        # Equirectangular approximation, see GeoFilter._fast_distance_km_sq;
+        # the longitude difference is wrapped into [-pi, pi)
+        dlon = (math.radians(lon) - lon0_rad + math.pi) % TWO_PI - math.pi
+        dx = dlon * cos_lat0
+        dy = math.radians(lat) - lat0_rad
+        d_sq = EARTH_RADIUS_KM_SQ * (dx * dx + dy * dy)
+        distances_sq[i] = d_sq
+        mask[i] = d_sq <= radius_km_sq and min_alt_ft <= alt <= max_alt_ft
+
+    return mask, distances_sq
@@ -2,10 +2,16 @@
 ADS-B data processor module.
 Fetches and processes aircraft data from ADS-B sources.
 """
-import json
+import orjson
 import requests
-from typing import List, Dict, Any
-from src.utils import Aircraft
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Callable, Iterable, Iterator, TypeVar
+from src.utils import Aircraft, AircraftBatch
+
+T = TypeVar('T')
+
+# File extensions treated as newline-delimited JSON (one document per line)
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
 
 
 class ADSBProcessor:
@@ -26,10 +32,21 @@ class ADSBProcessor:
         self.data_source = data_source
         self.max_age = max_age
 
+        # Reuse one keep-alive connection across polls instead of
+        # reconnecting every update interval
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
     def _is_http_source(self) -> bool:
         """Check if data source is HTTP/HTTPS URL."""
         return self.data_source.startswith(('http://', 'https://'))
 
+    def _is_ndjson_source(self) -> bool:
+        """Check if data source is a newline-delimited JSON feed."""
+        return self.data_source.lower().endswith(NDJSON_EXTENSIONS)
+
     def fetch_aircraft_data(self) -> List[Aircraft]:
         """
         Fetch aircraft data from configured source.
@@ -37,73 +54,163 @@ class ADSBProcessor:
         Returns:
             List of Aircraft objects
         """
+        return self._fetch(self._parse_fresh, [])
+
+    def fetch_aircraft_batch(self) -> AircraftBatch:
+        """
+        Fetch aircraft data as a column-oriented batch.
+
+        No Aircraft objects are created; callers materialize only the
+        entries they need (e.g. overhead hits) via AircraftBatch.as_aircraft.
+
+        Returns:
+            AircraftBatch of aircraft within max_age
+        """
+        return self._fetch(self._build_batch, AircraftBatch.empty())
+
+    def _fetch(self, consume: Callable[[Iterable[Dict[str, Any]]], T], empty: T) -> T:
+        """
+        Fetch raw aircraft records from the configured source.
+
+        Args:
+            consume: Callable turning raw aircraft records into the result
+            empty: Result returned when fetching fails
+
+        Returns:
+            Result of consume, or empty on error
+        """
         try:
             if self._is_http_source():
-                return self._fetch_from_http()
+                return self._fetch_from_http(consume, empty)
             else:
-                return self._fetch_from_file()
+                return self._fetch_from_file(consume, empty)
         except Exception as e:
             print(f"Error fetching aircraft data: {e}")
-            return []
+            return empty
 
-    def _fetch_from_http(self) -> List[Aircraft]:
+    def _fetch_from_http(self, consume: Callable[[Iterable[Dict[str, Any]]], T], empty: T) -> T:
         """
         Fetch aircraft data from HTTP source.
 
+        Args:
+            consume: Callable turning raw aircraft records into the result
+            empty: Result returned when fetching fails
+
         Returns:
-            List of Aircraft objects
+            Result of consume, or empty on error
         """
         try:
-            response = requests.get(self.data_source, timeout=10)
+            response = self._session.get(self.data_source, timeout=10)
             response.raise_for_status()
-            data = response.json()
-
-            aircraft_list = []
-            for aircraft_data in data.get('aircraft', []):
-                aircraft = self.parse_aircraft(aircraft_data)
-                aircraft_list.append(aircraft)
+            # Parse the raw bytes directly; skips the str decode and stdlib json
+            data = orjson.loads(response.content)
 
-            # Filter by age
-            return self.filter_by_age(aircraft_list)
+            return consume(data.get('aircraft', []))
 
         except requests.RequestException as e:
             print(f"HTTP request error: {e}")
-            return []
-        except json.JSONDecodeError as e:
+            return empty
+        except orjson.JSONDecodeError as e:
             print(f"JSON decode error: {e}")
-            return []
+            return empty
         except Exception as e:
             print(f"Unexpected error: {e}")
-            return []
+            return empty
 
-    def _fetch_from_file(self) -> List[Aircraft]:
+    def _fetch_from_file(self, consume: Callable[[Iterable[Dict[str, Any]]], T], empty: T) -> T:
         """
         Fetch aircraft data from local file.
 
+        Args:
+            consume: Callable turning raw aircraft records into the result
+            empty: Result returned when fetching fails
+
         Returns:
-            List of Aircraft objects
+            Result of consume, or empty on error
         """
         try:
-            with open(self.data_source, 'r') as f:
-                data = json.load(f)
+            if self._is_ndjson_source():
+                with open(self.data_source, 'rb') as f:
+                    return consume(self._iter_ndjson_records(f))
 
-            aircraft_list = []
-            for aircraft_data in data.get('aircraft', []):
-                aircraft = self.parse_aircraft(aircraft_data)
-                aircraft_list.append(aircraft)
+            with open(self.data_source, 'rb') as f:
+                data = orjson.loads(f.read())
 
-            # Filter by age
-            return self.filter_by_age(aircraft_list)
+            return consume(data.get('aircraft', []))
 
         except FileNotFoundError:
             print(f"File not found: {self.data_source}")
-            return []
-        except json.JSONDecodeError as e:
+            return empty
+        except orjson.JSONDecodeError as e:
             print(f"JSON decode error: {e}")
-            return []
+            return empty
         except Exception as e:
             print(f"Unexpected error: {e}")
-            return []
+            return empty
+
+    @staticmethod
+    def _iter_ndjson_records(lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream aircraft records from a newline-delimited JSON feed.
+
+        Each line is parsed on its own, so memory stays bounded by the
+        largest line rather than the whole file. Lines may hold a single
+        aircraft record or a full snapshot with an 'aircraft' list.
+
+        Args:
+            lines: Iterable of raw JSON lines
+
+        Yields:
+            Raw aircraft data dictionaries
+        """
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            record = orjson.loads(line)
+            if 'aircraft' in record:
+                yield from record['aircraft']
+            else:
+                yield record
+
+    def _parse_fresh(self, records: Iterable[Dict[str, Any]]) -> List[Aircraft]:
+        """
+        Parse raw records into Aircraft objects, skipping stale entries.
+
+        Parsing and age filtering happen in a single pass so no Aircraft
+        is constructed for records older than max_age.
+
+        Args:
+            records: Iterable of raw aircraft data dictionaries
+
+        Returns:
+            List of Aircraft objects within max_age
+        """
+        max_age = self.max_age
+        return [
+            self.parse_aircraft(record)
+            for record in records
+            if record.get('seen', 0) <= max_age
+        ]
+
+    def _build_batch(self, records: Iterable[Dict[str, Any]]) -> AircraftBatch:
+        """
+        Build a column-oriented batch from raw records, dropping stale entries.
+
+        Stale records are skipped before the columns are built, so no
+        column values or masked copies are produced for them.
+
+        Args:
+            records: Iterable of raw aircraft data dictionaries
+
+        Returns:
+            AircraftBatch of aircraft within max_age
+        """
+        max_age = self.max_age
+        return AircraftBatch.from_records(
+            [record for record in records if record.get('seen', 0) <= max_age]
+        )
 
     def parse_aircraft(self, aircraft_data: Dict[str, Any]) -> Aircraft:
         """
@@ -128,9 +235,5 @@ class ADSBProcessor:
         Returns:
             Filtered list of Aircraft objects
         """
-        filtered = []
-        for aircraft in aircraft_list:
-            if aircraft.last_seen <= self.max_age:
-                filtered.append(aircraft)
-
-        return filtered
+        max_age = self.max_age
+        return [aircraft for aircraft in aircraft_list if aircraft.last_seen <= max_age]
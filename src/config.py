@@ -2,10 +2,29 @@
 Configuration module for flight tracker.
 Handles loading and accessing configuration from YAML file.
 """
+import os
+import copy
 import yaml
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from pathlib import Path
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+# Parsed YAML shared across Config instances: abs path -> (file stamp, data).
+# Components that each build a Config for the same file parse it only once.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Key paths that must be present (and not null) for a usable configuration
+REQUIRED_FIELDS = frozenset({
+    'location.latitude',
+    'location.longitude',
+})
+
 
 class Config:
     """Configuration manager for flight tracker."""
@@ -19,12 +38,18 @@ class Config:
         """
         self.config_path = config_path
         self.config_data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
         self.load()
 
     def load(self) -> None:
         """Load configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            self.config_data = yaml.safe_load(f)
+        stamp = self._file_stamp()
+        self.config_data = self._parse(stamp)
+        self._stamp = stamp
+
+        # Index every dot-separated key path once so get() is a single lookup
+        self._flat = self._flatten(self.config_data)
 
         # Set convenience properties
         self.location = self.config_data.get('location', {})
@@ -34,63 +59,145 @@ class Config:
         self.adsb = self.config_data.get('adsb', {})
         self.logging = self.config_data.get('logging', {})
 
+    @staticmethod
+    def _flatten(data: Any, prefix: str = '') -> Dict[str, Any]:
+        """
+        Flatten nested configuration into dot-separated key paths.
+
+        Both leaf values and intermediate sections are indexed, so
+        'location' and 'location.latitude' are both present.
+
+        Args:
+            data: Nested configuration data
+            prefix: Key path of the enclosing section
+
+        Returns:
+            Dictionary mapping key paths to values
+        """
+        flat: Dict[str, Any] = {}
+        if not isinstance(data, dict):
+            return flat
+
+        for k, value in data.items():
+            path = f"{prefix}{k}"
+            flat[path] = value
+            flat.update(Config._flatten(value, f"{path}."))
+
+        return flat
+
+    def _parse(self, stamp: Optional[Tuple[int, int]]) -> Any:
+        """
+        Parse the configuration file, reusing a cached parse when unchanged.
+
+        Args:
+            stamp: Current file stamp, or None to bypass the cache
+
+        Returns:
+            Parsed configuration data (private copy for this instance)
+        """
+        if stamp is None:
+            return self._read_yaml()
+
+        key = os.path.abspath(self.config_path)
+        cached = _PARSE_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, self._read_yaml())
+            _PARSE_CACHE[key] = cached
+
+        # Copy so one instance mutating its config cannot affect another
+        return copy.deepcopy(cached[1])
+
+    def _read_yaml(self) -> Any:
+        """
+        Read and parse the configuration file.
+
+        The file is read as raw bytes so the loader decodes UTF-8 itself
+        instead of going through a Python text stream.
+
+        Returns:
+            Parsed configuration data
+        """
+        with open(self.config_path, 'rb') as f:
+            return yaml.load(f.read(), Loader=YAMLLoader)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all cached parses so the next load re-reads from disk."""
+        _PARSE_CACHE.clear()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the modification stamp of the configuration file.
+
+        Returns:
+            (mtime in nanoseconds, size) tuple, or None if the file cannot be stat'ed
+        """
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def reload(self) -> None:
-        """Reload configuration from file."""
+        """Reload configuration from file if it changed since the last load."""
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
         self.load()
 
-    def get_location(self) -> Dict[str, Any]:
+    def get_location(self) -> Mapping[str, Any]:
         """
         Get location configuration.
 
         Returns:
-            Location configuration dictionary
+            Read-only view of the location configuration
         """
-        return self.location
+        return MappingProxyType(self.location)
 
-    def get_overhead_zone(self) -> Dict[str, Any]:
+    def get_overhead_zone(self) -> Mapping[str, Any]:
         """
         Get overhead zone configuration.
 
         Returns:
-            Overhead zone configuration dictionary
+            Read-only view of the overhead zone configuration
         """
-        return self.overhead_zone
+        return MappingProxyType(self.overhead_zone)
 
-    def get_display_config(self) -> Dict[str, Any]:
+    def get_display_config(self) -> Mapping[str, Any]:
         """
         Get display configuration.
 
         Returns:
-            Display configuration dictionary
+            Read-only view of the display configuration
         """
-        return self.display
+        return MappingProxyType(self.display)
 
-    def get_api_config(self) -> Dict[str, Any]:
+    def get_api_config(self) -> Mapping[str, Any]:
         """
         Get API configuration.
 
         Returns:
-            API configuration dictionary
+            Read-only view of the API configuration
         """
-        return self.api
+        return MappingProxyType(self.api)
 
-    def get_adsb_config(self) -> Dict[str, Any]:
+    def get_adsb_config(self) -> Mapping[str, Any]:
         """
         Get ADS-B configuration.
 
         Returns:
-            ADS-B configuration dictionary
+            Read-only view of the ADS-B configuration
         """
-        return self.adsb
+        return MappingProxyType(self.adsb)
 
-    def get_logging_config(self) -> Dict[str, Any]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """
         Get logging configuration.
 
         Returns:
-            Logging configuration dictionary
+            Read-only view of the logging configuration
         """
-        return self.logging
+        return MappingProxyType(self.logging)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -103,16 +210,7 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self.config_data
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def validate_required_fields(self) -> bool:
         """
@@ -121,13 +219,5 @@ class Config:
         Returns:
             True if all required fields present, False otherwise
         """
-        required_fields = [
-            'location.latitude',
-            'location.longitude',
-        ]
-
-        for field in required_fields:
-            if self.get(field) is None:
-                return False
-
-        return True
+        flat = self._flat
+        return all(flat.get(field) is not None for field in REQUIRED_FIELDS)
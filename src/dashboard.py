@@ -3,12 +3,17 @@ Web dashboard for flight tracker monitoring.
 Provides real-time status, statistics, and control interface.
 """
 import os
+import math
 import time
-import json
 import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
+from typing import Any, List, Optional
+import numpy as np
+import orjson
+from flask import Flask, Response, render_template, request
 from flask_cors import CORS
 from src.config import Config
 from src.adsb_processor import ADSBProcessor
@@ -22,6 +27,24 @@ if DEMO_MODE:
     from src.demo_data import DemoDataGenerator
 
 
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Serialize payload with orjson into a JSON response.
+
+    Args:
+        payload: JSON-serializable object
+        status: HTTP status code
+
+    Returns:
+        Flask response with application/json body
+    """
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+
 class FlightTrackerDashboard:
     """Web dashboard for flight tracker."""
 
@@ -55,7 +78,12 @@ class FlightTrackerDashboard:
 
         self.current_aircraft = []
         self.overhead_aircraft = []
-        self.recent_flights = []
+        # Guards stats and recent flights shared with the updater thread
+        self._lock = threading.Lock()
+        self.recent_flights = deque(maxlen=self.config.get('dashboard.recent_max', 500))
+        self._recent_icaos = set()  # Mirrors recent_flights for O(1) lookups
+        # Pre-serialized /api/aircraft and /api/overhead bodies, rebuilt per update
+        self._publish_aircraft_payloads([], [])
 
         # Demo mode setup
         self.demo_mode = DEMO_MODE
@@ -66,6 +94,21 @@ class FlightTrackerDashboard:
                 center_lon=location['longitude']
             )
 
+        # (whole seconds, formatted text) of the last uptime served
+        self._uptime_text = (-1, '')
+
+        # Location and zone never change at runtime; serialize them once
+        self._status_location = orjson.Fragment(orjson.dumps({
+            'latitude': self.config.get('location.latitude'),
+            'longitude': self.config.get('location.longitude'),
+            'name': 'Footscray, Melbourne, VIC'
+        }))
+        self._status_zone = orjson.Fragment(orjson.dumps({
+            'radius_km': self.config.get('overhead_zone.radius_km'),
+            'min_altitude_m': self.config.get('overhead_zone.min_altitude_m'),
+            'max_altitude_m': self.config.get('overhead_zone.max_altitude_m')
+        }))
+
         # Setup routes
         self._setup_routes()
 
@@ -92,7 +135,9 @@ class FlightTrackerDashboard:
         self.flight_api = FlightAPIClient(
             provider=api_config.get('provider', 'opensky'),
             api_key=api_config.get('api_key', ''),
-            cache_duration=api_config.get('cache_duration', 300)
+            cache_duration=api_config.get('cache_duration', 300),
+            cache_size=api_config.get('cache_size', 10000),
+            rate_limit_delay=api_config.get('rate_limit_delay', 1.0)
         )
 
     def _setup_routes(self) -> None:
@@ -106,68 +151,56 @@ class FlightTrackerDashboard:
         @self.app.route('/api/status')
         def status():
             """Get system status."""
-            uptime = time.time() - self.stats['uptime_start']
-            return jsonify({
+            uptime = int(time.time() - self.stats['uptime_start'])
+            return _json_response({
                 'status': 'running',
-                'uptime_seconds': int(uptime),
-                'uptime_formatted': self._format_uptime(uptime),
+                'uptime_seconds': uptime,
+                'uptime_formatted': self._cached_uptime_text(uptime),
                 'last_update': self.stats['last_update'],
-                'location': {
-                    'latitude': self.config.get('location.latitude'),
-                    'longitude': self.config.get('location.longitude'),
-                    'name': 'Footscray, Melbourne, VIC'
-                },
-                'overhead_zone': {
-                    'radius_km': self.config.get('overhead_zone.radius_km'),
-                    'min_altitude_m': self.config.get('overhead_zone.min_altitude_m'),
-                    'max_altitude_m': self.config.get('overhead_zone.max_altitude_m')
-                }
+                'location': self._status_location,
+                'overhead_zone': self._status_zone
             })
 
         @self.app.route('/api/stats')
         def stats():
             """Get statistics."""
-            return jsonify(self.stats)
+            with self._lock:
+                snapshot = dict(self.stats)
+            return _json_response(snapshot)
 
         @self.app.route('/api/aircraft')
         def aircraft():
             """Get current aircraft list."""
-            return jsonify({
-                'total': len(self.current_aircraft),
-                'overhead': len(self.overhead_aircraft),
-                'aircraft': [self._aircraft_to_dict(a) for a in self.current_aircraft]
-            })
+            return Response(self._aircraft_json, mimetype='application/json')
 
         @self.app.route('/api/overhead')
         def overhead():
             """Get overhead aircraft."""
-            return jsonify({
-                'count': len(self.overhead_aircraft),
-                'aircraft': [self._aircraft_to_dict(a) for a in self.overhead_aircraft]
-            })
+            return Response(self._overhead_json, mimetype='application/json')
 
         @self.app.route('/api/recent')
         def recent():
             """Get recent flights."""
-            return jsonify({
-                'flights': self.recent_flights[-20:]  # Last 20 flights
-            })
+            with self._lock:
+                start = max(0, len(self.recent_flights) - 20)
+                flights = list(islice(self.recent_flights, start, None))  # Last 20 flights
+            return _json_response({'flights': flights})
 
         @self.app.route('/api/update')
         def update():
             """Trigger manual update."""
             try:
                 self._update_data()
-                return jsonify({'success': True, 'message': 'Updated successfully'})
+                return _json_response({'success': True, 'message': 'Updated successfully'})
             except Exception as e:
-                return jsonify({'success': False, 'error': str(e)}), 500
+                return _json_response({'success': False, 'error': str(e)}, 500)
 
         @self.app.route('/api/config')
         def config():
             """Get configuration."""
-            return jsonify({
-                'location': self.config.get_location(),
-                'overhead_zone': self.config.get_overhead_zone(),
+            return _json_response({
+                'location': dict(self.config.get_location()),
+                'overhead_zone': dict(self.config.get_overhead_zone()),
                 'api': {
                     'provider': self.config.get('api.provider'),
                     'cache_duration': self.config.get('api.cache_duration')
@@ -178,14 +211,39 @@ class FlightTrackerDashboard:
                 }
             })
 
-    def _aircraft_to_dict(self, aircraft) -> dict:
-        """Convert Aircraft object to dictionary."""
-        distance = None
-        if aircraft.latitude and aircraft.longitude:
-            distance = round(self.geo_filter.calculate_distance(
-                aircraft.latitude, aircraft.longitude
-            ), 2)
+    def _aircraft_to_dicts(self, aircraft_list: List[Any]) -> List[dict]:
+        """
+        Convert Aircraft objects to dictionaries.
+        Distances for the whole list are computed in one vectorized pass.
+
+        Args:
+            aircraft_list: List of Aircraft objects
+
+        Returns:
+            List of aircraft dictionaries
+        """
+        if not aircraft_list:
+            return []
+
+        count = len(aircraft_list)
+        nan = math.nan
+        lats = np.fromiter(
+            (nan if a.latitude is None else a.latitude for a in aircraft_list),
+            dtype=np.float64, count=count
+        )
+        lons = np.fromiter(
+            (nan if a.longitude is None else a.longitude for a in aircraft_list),
+            dtype=np.float64, count=count
+        )
+        distances = np.round(self.geo_filter.batch_distance(lats, lons), 2)
+
+        return [
+            self._build_aircraft_dict(a, None if math.isnan(d) else d)
+            for a, d in zip(aircraft_list, distances.tolist())
+        ]
 
+    def _build_aircraft_dict(self, aircraft, distance: Optional[float]) -> dict:
+        """Build the dictionary representation of an aircraft."""
         return {
             'icao': aircraft.icao,
             'callsign': aircraft.callsign,
@@ -202,13 +260,67 @@ class FlightTrackerDashboard:
             'last_seen': aircraft.last_seen
         }
 
+    def _publish_aircraft_payloads(self, aircraft_list: List[Any],
+                                   overhead: List[Any]) -> None:
+        """
+        Serialize the aircraft endpoint bodies once per update cycle.
+        Both payloads are built before being swapped in, so readers always
+        see complete bytes from a single update.
+
+        Args:
+            aircraft_list: All currently tracked aircraft
+            overhead: Aircraft currently overhead
+        """
+        aircraft_dicts = self._aircraft_to_dicts(aircraft_list)
+
+        # Overhead aircraft are normally objects from aircraft_list, so their
+        # dicts (and distances) are reused; only others (e.g. demo mode's
+        # separately generated overhead aircraft) are converted again
+        by_id = {id(a): d for a, d in zip(aircraft_list, aircraft_dicts)}
+        overhead_dicts = [by_id.get(id(a)) for a in overhead]
+        if None in overhead_dicts:
+            missing = [a for a, d in zip(overhead, overhead_dicts) if d is None]
+            converted = iter(self._aircraft_to_dicts(missing))
+            overhead_dicts = [d if d is not None else next(converted)
+                              for d in overhead_dicts]
+
+        aircraft_json = orjson.dumps({
+            'total': len(aircraft_list),
+            'overhead': len(overhead),
+            'aircraft': aircraft_dicts
+        })
+        overhead_json = orjson.dumps({
+            'count': len(overhead),
+            'aircraft': overhead_dicts
+        })
+
+        with self._lock:
+            self._aircraft_json = aircraft_json
+            self._overhead_json = overhead_json
+
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime seconds to human readable."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours}h {minutes}m {secs}s"
 
+    def _cached_uptime_text(self, seconds: int) -> str:
+        """
+        Format uptime at most once per second across status polls.
+
+        Args:
+            seconds: Whole seconds of uptime
+
+        Returns:
+            Human readable uptime
+        """
+        cached_seconds, text = self._uptime_text
+        if cached_seconds != seconds:
+            text = self._format_uptime(seconds)
+            # Single tuple assignment keeps seconds and text consistent
+            self._uptime_text = (seconds, text)
+        return text
+
     def _update_data(self) -> None:
         """Update aircraft data."""
         try:
@@ -224,18 +336,26 @@ class FlightTrackerDashboard:
 
             self.current_aircraft = aircraft_list
 
-            if aircraft_list:
+            # Track new overhead aircraft
+            new_overhead = [a for a in overhead if a.icao not in self._recent_icaos]
+
+            api_calls = 0
+            if new_overhead:
+                # Enrich with flight data (batched or concurrent lookups)
+                api_calls = self.flight_api.enrich_multiple_aircraft(new_overhead)
+
+            with self._lock:
                 self.stats['total_aircraft_seen'] += len(aircraft_list)
+                self.stats['api_calls'] += api_calls
 
-            # Track new overhead aircraft
-            for aircraft in overhead:
-                if aircraft.icao not in [a['icao'] for a in self.recent_flights]:
-                    # Enrich with flight data
-                    self.flight_api.enrich_aircraft(aircraft)
-                    self.stats['api_calls'] += 1
+                for aircraft in new_overhead:
+                    # An overlapping update may have recorded it since the
+                    # unlocked check above
+                    if aircraft.icao in self._recent_icaos:
+                        continue
 
                     # Add to recent flights
-                    self.recent_flights.append({
+                    self._add_recent_flight({
                         'icao': aircraft.icao,
                         'callsign': aircraft.callsign or 'Unknown',
                         'origin': aircraft.origin_country or 'Unknown',
@@ -244,14 +364,32 @@ class FlightTrackerDashboard:
                         'altitude': aircraft.altitude
                     })
 
-            self.overhead_aircraft = overhead
-            self.stats['overhead_aircraft_count'] = len(overhead)
-            self.stats['last_update'] = datetime.now().isoformat()
+                self.overhead_aircraft = overhead
+                self.stats['overhead_aircraft_count'] = len(overhead)
+                self.stats['last_update'] = datetime.now().isoformat()
+
+            self._publish_aircraft_payloads(aircraft_list, overhead)
 
         except Exception as e:
-            self.stats['errors'] += 1
+            with self._lock:
+                self.stats['errors'] += 1
             print(f"Error updating data: {e}")
 
+    def _add_recent_flight(self, flight: dict) -> None:
+        """
+        Append a flight to recent flights, keeping the ICAO index in sync.
+        Callers must hold self._lock.
+
+        Args:
+            flight: Recent flight entry with an 'icao' key
+        """
+        if len(self.recent_flights) == self.recent_flights.maxlen:
+            # The oldest entry is about to be evicted by the deque
+            self._recent_icaos.discard(self.recent_flights[0]['icao'])
+
+        self.recent_flights.append(flight)
+        self._recent_icaos.add(flight['icao'])
+
     def start_background_updates(self, interval: int = 5):
         """
         Start background data updates.
@@ -283,7 +421,10 @@ class FlightTrackerDashboard:
         print(f"Dashboard running at http://{host}:{port}")
         print("Press Ctrl+C to stop")
 
-        self.app.run(host=host, port=port, debug=debug, use_reloader=False)
+        # Development server only; deployments run wsgi:app under gunicorn
+        # with gthread workers (see render.yaml)
+        self.app.run(host=host, port=port, debug=debug, use_reloader=False,
+                     threaded=True)
 
 
 def main():
@@ -3,22 +3,87 @@ Flight API client module.
 Enriches aircraft data with flight information from various APIs.
 """
 import time
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from typing import Dict, Any, Optional, List
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Mapping, Optional, List
 from pathlib import Path
 from src.utils import Aircraft
 
+# Try to import simdjson for lazy parsing of the airport database
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+    simdjson = None
+
+# OpenSky state vector lookup; the lowercase icao24 is appended per request
+OPENSKY_STATES_ENDPOINT = "https://opensky-network.org/api/states/all"
+OPENSKY_STATES_URL = OPENSKY_STATES_ENDPOINT + "?icao24="
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket on the monotonic clock.
+
+    Callers may take the bucket negative to reserve a future slot; they
+    then sleep outside the lock until that slot, so concurrent callers
+    queue up in order without holding the lock while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens that can accumulate while idle
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
 
 class FlightAPIClient:
     """Client for flight information APIs."""
 
+    # Airport database shared by every client; loaded from disk once
+    _airport_db_cache: Optional[Mapping[str, Any]] = None
+    _airport_db_lock = threading.Lock()
+
     def __init__(
         self,
         provider: str = "opensky",
         api_key: str = "",
         cache_duration: int = 300,
-        request_timeout: int = 10
+        request_timeout: int = 10,
+        max_concurrent_requests: int = 4,
+        cache_size: int = 10000,
+        rate_limit_delay: float = 1.0
     ):
         """
         Initialize flight API client.
@@ -28,26 +93,64 @@ class FlightAPIClient:
             api_key: API key if required
             cache_duration: Cache duration in seconds
             request_timeout: Request timeout in seconds
+            max_concurrent_requests: Maximum lookups in flight at once
+            cache_size: Maximum number of aircraft kept in the cache
+            rate_limit_delay: Minimum average delay between API requests in seconds
+                (0 to disable)
         """
         self.provider = provider
         self.api_key = api_key
         self.cache_duration = cache_duration
         self.request_timeout = request_timeout
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._last_request_time = 0
-        self._airport_db = self._load_airport_database()
-
-    def _load_airport_database(self) -> Dict[str, Dict[str, Any]]:
+        self.max_concurrent_requests = max_concurrent_requests
+        # Bounded cache: entries expire cache_duration seconds after insertion
+        # and the least recently used is evicted once cache_size is reached
+        self._cache: TTLCache = TTLCache(
+            maxsize=cache_size, ttl=cache_duration, timer=time.monotonic
+        )
+        self._cache_lock = threading.Lock()
+        # A non-positive delay disables rate limiting
+        self._rate_limiter = (
+            _RateLimiter(rate=1.0 / rate_limit_delay) if rate_limit_delay > 0 else None
+        )
+
+        # Pooled keep-alive connections avoid a TCP/TLS handshake per lookup
+        self._session = requests.Session()
+        # Transient upstream errors are retried on the pooled connection
+        # instead of failing the lookup. 429s are not retried here, since
+        # that would bypass _rate_limit, and Retry-After is ignored so a
+        # server cannot stall the enrichment pool for an unbounded time
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            respect_retry_after_header=False
+        )
+        self._session.mount(
+            'https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        )
+
+        self._airport_db: Mapping[str, Any] = self._shared_airport_database()
+
+    def _load_airport_database(self) -> Mapping[str, Any]:
         """
         Load airport database from local file.
 
+        When simdjson is available the file is parsed into a lazy document
+        and records are only converted to Python objects on lookup.
+
         Returns:
-            Dictionary of airport data
+            Dictionary (or simdjson object) of airport data
         """
         try:
             airport_file = Path(__file__).parent.parent / 'data' / 'airports.json'
-            with open(airport_file, 'r') as f:
-                return json.load(f)
+            with open(airport_file, 'rb') as f:
+                raw = f.read()
+
+            if SIMDJSON_AVAILABLE:
+                return simdjson.Parser().parse(raw)
+            return orjson.loads(raw)
         except FileNotFoundError:
             print("Airport database not found")
             return {}
@@ -55,6 +158,46 @@ class FlightAPIClient:
             print(f"Error loading airport database: {e}")
             return {}
 
+    def _shared_airport_database(self) -> Mapping[str, Any]:
+        """
+        Get the airport database, loading it on first use by any client.
+
+        Failed loads are not cached, so a later client can still succeed.
+
+        Returns:
+            Dictionary (or simdjson object) of airport data
+        """
+        with FlightAPIClient._airport_db_lock:
+            if FlightAPIClient._airport_db_cache is None:
+                db = self._load_airport_database()
+                if not db:
+                    return db
+                FlightAPIClient._airport_db_cache = db
+            return FlightAPIClient._airport_db_cache
+
+    @staticmethod
+    def invalidate_airport_cache() -> None:
+        """Drop the shared airport database so the next client reloads it."""
+        with FlightAPIClient._airport_db_lock:
+            FlightAPIClient._airport_db_cache = None
+
+    def get_airport(self, code: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an airport record from the airport database.
+
+        Args:
+            code: Airport code (e.g., 'LHR')
+
+        Returns:
+            Airport data dictionary, or None if unknown
+        """
+        entry = self._airport_db.get(code)
+        if entry is None:
+            return None
+
+        # simdjson records are materialized only when actually queried
+        return entry.as_dict() if hasattr(entry, 'as_dict') else entry
+
     def _is_cached(self, icao: str) -> bool:
         """
         Check if aircraft data is cached and not expired.
@@ -65,12 +208,8 @@ class FlightAPIClient:
         Returns:
             True if cached and valid, False otherwise
         """
-        if icao not in self._cache:
-            return False
-
-        cache_entry = self._cache[icao]
-        age = time.time() - cache_entry['timestamp']
-        return age < self.cache_duration
+        with self._cache_lock:
+            return icao in self._cache
 
     def _get_cached_data(self, icao: str) -> Dict[str, Any]:
         """
@@ -80,9 +219,10 @@ class FlightAPIClient:
             icao: Aircraft ICAO code
 
         Returns:
-            Cached data dictionary
+            Cached data dictionary (empty if not cached or expired)
         """
-        return self._cache.get(icao, {})
+        with self._cache_lock:
+            return self._cache.get(icao, {})
 
     def _cache_data(self, icao: str, data: Dict[str, Any]) -> None:
         """
@@ -92,48 +232,82 @@ class FlightAPIClient:
             icao: Aircraft ICAO code
             data: Data to cache
         """
-        self._cache[icao] = {
-            **data,
-            'timestamp': time.time()
-        }
+        with self._cache_lock:
+            self._cache[icao] = data
 
-    def _rate_limit(self, delay: float = 1.0) -> None:
+    def _rate_limit(self) -> None:
         """
         Implement rate limiting between requests.
 
-        Args:
-            delay: Minimum delay between requests in seconds
+        Safe to call from several threads; request start times stay
+        spaced while responses overlap.
         """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < delay:
-            time.sleep(delay - time_since_last)
-        self._last_request_time = time.time()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
 
-    def enrich_aircraft(self, aircraft: Aircraft) -> None:
+    def enrich_aircraft(self, aircraft: Aircraft) -> int:
         """
         Enrich aircraft with flight information from API.
 
         Args:
             aircraft: Aircraft object to enrich
+
+        Returns:
+            Number of HTTP requests made (0 on a cache hit)
         """
         # Check cache first
-        if self._is_cached(aircraft.icao):
-            cached_data = self._get_cached_data(aircraft.icao)
-            aircraft.origin_country = cached_data.get('origin_country')
-            aircraft.destination_country = cached_data.get('destination_country')
-            aircraft.origin_airport = cached_data.get('origin_airport')
-            aircraft.destination_airport = cached_data.get('destination_airport')
-            aircraft.flight_number = cached_data.get('flight_number')
-            return
+        if self._apply_cached(aircraft):
+            return 0
 
         # Fetch from API based on provider
         if self.provider == "opensky":
             self._enrich_from_opensky(aircraft)
+            return 1
         elif self.provider == "adsbexchange":
             self._enrich_from_adsbexchange(aircraft)
         else:
             print(f"Unsupported provider: {self.provider}")
+        return 0
+
+    def _apply_cached(self, aircraft: Aircraft) -> bool:
+        """
+        Fill aircraft fields from the cache.
+
+        Args:
+            aircraft: Aircraft object to enrich
+
+        Returns:
+            True if cached data was applied, False on a cache miss
+        """
+        cached_data = self._get_cached_data(aircraft.icao)
+        if not cached_data:
+            return False
+
+        aircraft.origin_country = cached_data.get('origin_country')
+        aircraft.destination_country = cached_data.get('destination_country')
+        aircraft.origin_airport = cached_data.get('origin_airport')
+        aircraft.destination_airport = cached_data.get('destination_airport')
+        aircraft.flight_number = cached_data.get('flight_number')
+        return True
+
+    def _apply_opensky_state(self, aircraft: Aircraft, state: List[Any]) -> None:
+        """
+        Fill aircraft fields from an OpenSky state vector and cache them.
+
+        Args:
+            aircraft: Aircraft object to enrich
+            state: OpenSky state vector
+        """
+        # OpenSky state vector format:
+        # [0] icao24, [1] callsign, [2] origin_country, ...
+        origin_country = state[2] if len(state) > 2 else None
+
+        aircraft.origin_country = origin_country
+
+        # Cache the data
+        self._cache_data(aircraft.icao, {
+            'origin_country': origin_country
+        })
 
     def _enrich_from_opensky(self, aircraft: Aircraft) -> None:
         """
@@ -143,30 +317,56 @@ class FlightAPIClient:
             aircraft: Aircraft object to enrich
         """
         try:
-            self._rate_limit(1.0)
+            self._rate_limit()
 
-            url = f"https://opensky-network.org/api/states/all?icao24={aircraft.icao.lower()}"
-            response = requests.get(url, timeout=self.request_timeout)
+            url = OPENSKY_STATES_URL + aircraft.icao_lower
+            response = self._session.get(url, timeout=self.request_timeout)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             states = data.get('states')
 
             if states and len(states) > 0:
-                state = states[0]
-                # OpenSky state vector format:
-                # [0] icao24, [1] callsign, [2] origin_country, ...
-                origin_country = state[2] if len(state) > 2 else None
+                self._apply_opensky_state(aircraft, states[0])
 
-                aircraft.origin_country = origin_country
+        except Exception as e:
+            print(f"Error enriching from OpenSky: {e}")
 
-                # Cache the data
-                self._cache_data(aircraft.icao, {
-                    'origin_country': origin_country
-                })
+    def _enrich_batch_from_opensky(self, aircraft_list: List[Aircraft]) -> bool:
+        """
+        Enrich several aircraft with a single OpenSky request.
+
+        OpenSky accepts repeated icao24 parameters, so one round trip and
+        one rate-limit slot cover the whole batch.
+
+        Args:
+            aircraft_list: Aircraft objects to enrich (none of them cached)
+
+        Returns:
+            True if the batch request succeeded, False if callers should
+            fall back to per-aircraft lookups
+        """
+        try:
+            self._rate_limit()
+
+            params = [('icao24', aircraft.icao_lower) for aircraft in aircraft_list]
+            response = self._session.get(
+                OPENSKY_STATES_ENDPOINT, params=params, timeout=self.request_timeout
+            )
+            response.raise_for_status()
 
+            data = orjson.loads(response.content)
         except Exception as e:
-            print(f"Error enriching from OpenSky: {e}")
+            print(f"Error batch enriching from OpenSky: {e}")
+            return False
+
+        states = {state[0]: state for state in data.get('states') or () if state}
+        for aircraft in aircraft_list:
+            state = states.get(aircraft.icao_lower)
+            if state is not None:
+                self._apply_opensky_state(aircraft, state)
+
+        return True
 
     def _enrich_from_adsbexchange(self, aircraft: Aircraft) -> None:
         """
@@ -211,12 +411,36 @@ class FlightAPIClient:
         # Placeholder - actual implementation would need route database
         return None
 
-    def enrich_multiple_aircraft(self, aircraft_list: List[Aircraft]) -> None:
+    def enrich_multiple_aircraft(self, aircraft_list: List[Aircraft]) -> int:
         """
         Enrich multiple aircraft with flight information.
 
+        With OpenSky, uncached aircraft are looked up in one batched
+        request. Otherwise (or if the batch fails) lookups run concurrently
+        so their network latency overlaps; the shared rate limiter still
+        spaces out request start times.
+
         Args:
             aircraft_list: List of Aircraft objects to enrich
+
+        Returns:
+            Number of HTTP requests made
         """
-        for aircraft in aircraft_list:
-            self.enrich_aircraft(aircraft)
+        requests_made = 0
+        if self.provider == "opensky" and len(aircraft_list) > 1:
+            pending = [a for a in aircraft_list if not self._apply_cached(a)]
+            if len(pending) > 1:
+                requests_made += 1
+                if self._enrich_batch_from_opensky(pending):
+                    return requests_made
+            aircraft_list = pending
+
+        if len(aircraft_list) <= 1:
+            for aircraft in aircraft_list:
+                requests_made += self.enrich_aircraft(aircraft)
+            return requests_made
+
+        workers = min(self.max_concurrent_requests, len(aircraft_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            requests_made += sum(executor.map(self.enrich_aircraft, aircraft_list))
+        return requests_made
@@ -3,8 +3,48 @@ Geographic filtering module for aircraft detection.
 Determines if aircraft are overhead based on location and altitude.
 """
 import math
+from operator import itemgetter
 from typing import List, Optional, Tuple
-from src.utils import Aircraft
+import numpy as np
+from src.utils import (Aircraft, AircraftBatch, COLUMN_DTYPE, EARTH_RADIUS_KM,
+                       EARTH_RADIUS_KM_SQ)
+
+# Try to import the numba-compiled kernels
+try:
+    from src._geo_kernels import haversine_km as _haversine_km
+    from src._geo_kernels import overhead_kernel as _overhead_kernel
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    _haversine_km = None
+    _overhead_kernel = None
+
+# Meters per foot; ADS-B reports barometric altitude in feet
+FT_TO_M = 0.3048
+
+TWO_PI = 2 * math.pi
+
+# Set once the numba kernels have been compiled or loaded for this process
+_kernels_warm = False
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile (or load from the on-disk cache) the overhead kernel once.
+
+    Called at startup by callers of GeoFilter.filter_overhead_batch so the
+    JIT cost is not paid on the first poll. Processes that never filter a
+    batch (e.g. the dashboard) skip it. The scalar Haversine kernel has an
+    explicit signature and is already compiled at import.
+    """
+    global _kernels_warm
+    if _kernels_warm or not NUMBA_AVAILABLE:
+        return
+
+    empty = np.empty(0, dtype=COLUMN_DTYPE)
+    zero = COLUMN_DTYPE(0.0)
+    _overhead_kernel(empty, empty, empty, zero, zero, zero, 0.0, 0.0, 0.0)
+    _kernels_warm = True
 
 
 class GeoFilter:
@@ -34,6 +74,19 @@ class GeoFilter:
         self.min_altitude_m = min_altitude_m
         self.max_altitude_m = max_altitude_m
 
+        # ADS-B altitudes are in feet; convert the limits once instead of
+        # converting every aircraft altitude to meters
+        self._min_alt_ft = min_altitude_m / FT_TO_M
+        self._max_alt_ft = math.inf if max_altitude_m is None else max_altitude_m / FT_TO_M
+
+        # The base location is fixed, so its trig terms are computed once
+        self._lat1_rad = math.radians(latitude)
+        self._lon1_rad = math.radians(longitude)
+        self._cos_lat1 = math.cos(self._lat1_rad)
+        self._sin_lat1 = math.sin(self._lat1_rad)
+        # Radius tests compare squared distances so rejects skip the sqrt
+        self._radius_km_sq = radius_km * radius_km
+
     def calculate_distance(self, lat: float, lon: float) -> float:
         """
         Calculate great circle distance between base location and given point.
@@ -46,25 +99,85 @@ class GeoFilter:
         Returns:
             Distance in kilometers
         """
-        # Earth radius in kilometers
-        R = 6371.0
+        if NUMBA_AVAILABLE:
+            return _haversine_km(self.latitude, self.longitude, lat, lon)
 
         # Convert to radians
-        lat1 = math.radians(self.latitude)
-        lon1 = math.radians(self.longitude)
         lat2 = math.radians(lat)
         lon2 = math.radians(lon)
 
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+        # Haversine formula; squares as products skip the float pow path
+        sin_dlat = math.sin((lat2 - self._lat1_rad) * 0.5)
+        sin_dlon = math.sin((lon2 - self._lon1_rad) * 0.5)
 
-        a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
+        a = (sin_dlat * sin_dlat +
+             self._cos_lat1 * math.cos(lat2) * sin_dlon * sin_dlon)
         c = 2 * math.asin(math.sqrt(a))
 
-        distance = R * c
-        return distance
+        return EARTH_RADIUS_KM * c
+
+    def batch_distance(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Calculate great circle distances for many points at once.
+        Vectorized Haversine formula over NumPy arrays.
+
+        Args:
+            lats: Target latitudes in degrees
+            lons: Target longitudes in degrees
+
+        Returns:
+            Array of distances in kilometers (NaN where position is NaN)
+        """
+        lat2 = np.radians(lats)
+        lon2 = np.radians(lons)
+
+        dlat = lat2 - self._lat1_rad
+        dlon = lon2 - self._lon1_rad
+
+        a = (np.sin(dlat * 0.5) ** 2 +
+             self._cos_lat1 * np.cos(lat2) * np.sin(dlon * 0.5) ** 2)
+        c = 2 * np.arcsin(np.sqrt(a))
+
+        return EARTH_RADIUS_KM * c
+
+    def _fast_distance_km_sq(self, lat: float, lon: float) -> float:
+        """
+        Approximate squared distance between base location and given point.
+
+        Equirectangular projection around the base latitude. Within the
+        overhead radius (a few km) the error against Haversine is well under
+        a meter, far below ADS-B position noise, and needs no trig beyond
+        the cached base terms. Squared so radius tests can skip the sqrt.
+
+        Args:
+            lat: Target latitude in degrees
+            lon: Target longitude in degrees
+
+        Returns:
+            Squared distance in square kilometers
+        """
+        # Wrap the longitude difference into [-pi, pi) so points across the
+        # antimeridian measure the short way round
+        dlon = (math.radians(lon) - self._lon1_rad + math.pi) % TWO_PI - math.pi
+        dx = dlon * self._cos_lat1
+        dy = math.radians(lat) - self._lat1_rad
+        return EARTH_RADIUS_KM_SQ * (dx * dx + dy * dy)
+
+    def _fast_distances_km_sq(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Vectorized squared equirectangular distances, see _fast_distance_km_sq.
+
+        Args:
+            lats: Target latitudes in degrees
+            lons: Target longitudes in degrees
+
+        Returns:
+            Array of squared distances in square kilometers (NaN where position is NaN)
+        """
+        dlon = np.remainder(np.radians(lons) - self._lon1_rad + math.pi, TWO_PI) - math.pi
+        dx = dlon * self._cos_lat1
+        dy = np.radians(lats) - self._lat1_rad
+        return EARTH_RADIUS_KM_SQ * (dx * dx + dy * dy)
 
     def get_bearing(self, lat: float, lon: float) -> float:
         """
@@ -77,16 +190,13 @@ class GeoFilter:
         Returns:
             Bearing in degrees (0-360)
         """
-        lat1 = math.radians(self.latitude)
-        lon1 = math.radians(self.longitude)
         lat2 = math.radians(lat)
-        lon2 = math.radians(lon)
-
-        dlon = lon2 - lon1
+        dlon = math.radians(lon) - self._lon1_rad
+        cos_lat2 = math.cos(lat2)
 
-        x = math.sin(dlon) * math.cos(lat2)
-        y = (math.cos(lat1) * math.sin(lat2) -
-             math.sin(lat1) * math.cos(lat2) * math.cos(dlon))
+        x = math.sin(dlon) * cos_lat2
+        y = (self._cos_lat1 * math.sin(lat2) -
+             self._sin_lat1 * cos_lat2 * math.cos(dlon))
 
         bearing = math.atan2(x, y)
         bearing = math.degrees(bearing)
@@ -105,7 +215,7 @@ class GeoFilter:
         Returns:
             Altitude in meters
         """
-        return feet * 0.3048
+        return feet * FT_TO_M
 
     def is_overhead(self, aircraft: Aircraft) -> bool:
         """
@@ -117,49 +227,108 @@ class GeoFilter:
         Returns:
             True if aircraft is overhead, False otherwise
         """
-        # Check if aircraft has valid position
-        if not aircraft.has_position():
-            return False
+        return self._distance_sq_if_overhead(aircraft) is not None
 
-        # Calculate distance
-        distance = self.calculate_distance(aircraft.latitude, aircraft.longitude)
+    def _distance_sq_if_overhead(self, aircraft: Aircraft) -> Optional[float]:
+        """
+        Get the squared distance to an aircraft if it is overhead.
 
-        # Check if within radius
-        if distance > self.radius_km:
-            return False
+        Checks run cheapest first: the altitude band is two comparisons, so
+        it is tested before any distance math. Squared distances order the
+        same as distances, so callers that only test or sort need no sqrt.
+
+        Args:
+            aircraft: Aircraft object with position data
 
-        # Convert altitude from feet to meters
-        altitude_m = self.feet_to_meters(aircraft.altitude)
+        Returns:
+            Approximate squared distance in square kilometers if overhead,
+            None otherwise
+        """
+        # Check if aircraft has valid position
+        if not aircraft.has_pos:
+            return None
 
-        # Check minimum altitude
-        if altitude_m < self.min_altitude_m:
-            return False
+        # Check altitude limits (in feet); non-numeric altitudes such as
+        # 'ground' never pass, as in the batch columns
+        altitude = aircraft.altitude
+        if not isinstance(altitude, (int, float)):
+            return None
+        if altitude < self._min_alt_ft or altitude > self._max_alt_ft:
+            return None
 
-        # Check maximum altitude (if specified)
-        if self.max_altitude_m is not None and altitude_m > self.max_altitude_m:
-            return False
+        # Check if within radius (squared, no sqrt needed)
+        distance_sq = self._fast_distance_km_sq(aircraft.latitude, aircraft.longitude)
+        if distance_sq > self._radius_km_sq:
+            return None
 
-        return True
+        return distance_sq
 
     def filter_overhead_aircraft(self, aircraft_list: List[Aircraft]) -> List[Aircraft]:
         """
         Filter aircraft list for overhead aircraft and sort by distance.
 
+        Aircraft that already exist as objects are checked one by one:
+        gathering their fields into columns costs more than the checks
+        themselves, most of which stop at the altitude band. Raw ADS-B
+        records should go through filter_overhead_batch instead.
+
         Args:
             aircraft_list: List of Aircraft objects
 
         Returns:
             List of overhead aircraft sorted by distance (closest first)
         """
-        overhead = []
-
+        hits = []
         for aircraft in aircraft_list:
-            if self.is_overhead(aircraft):
-                distance = self.calculate_distance(aircraft.latitude, aircraft.longitude)
-                overhead.append((distance, aircraft))
+            distance_sq = self._distance_sq_if_overhead(aircraft)
+            if distance_sq is not None:
+                hits.append((distance_sq, aircraft))
+
+        # Squared distance gives the same order; the sort is stable so
+        # ties keep input order, matching filter_overhead_batch
+        if len(hits) > 1:
+            hits.sort(key=itemgetter(0))
+
+        return [aircraft for _, aircraft in hits]
 
-        # Sort by distance (closest first)
-        overhead.sort(key=lambda x: x[0])
+    def filter_overhead_batch(self, batch: AircraftBatch) -> List[Aircraft]:
+        """
+        Filter a column-oriented aircraft batch for overhead aircraft.
+
+        Only the aircraft that pass the filter are materialized.
+
+        Args:
+            batch: AircraftBatch of candidate aircraft
 
-        # Return just the aircraft objects
-        return [aircraft for _, aircraft in overhead]
+        Returns:
+            List of overhead aircraft sorted by distance (closest first)
+        """
+        if not len(batch):
+            return []
+
+        lats = batch.lats
+        lons = batch.lons
+        alts = batch.alts
+
+        if NUMBA_AVAILABLE:
+            # Match the base point to the column dtype so the kernel stays in float32
+            as_dtype = lats.dtype.type
+            mask, distances_sq = _overhead_kernel(
+                lats, lons, alts, as_dtype(self._lat1_rad), as_dtype(self._lon1_rad),
+                as_dtype(self._cos_lat1), float(self._radius_km_sq),
+                float(self._min_alt_ft), float(self._max_alt_ft)
+            )
+        else:
+            distances_sq = self._fast_distances_km_sq(lats, lons)
+            mask = ((distances_sq <= self._radius_km_sq) &
+                    (alts >= self._min_alt_ft) &
+                    (alts <= self._max_alt_ft))
+
+        # Sort by distance (closest first); squared distance gives the same
+        # order, so no sqrt is taken. Stable to keep input order on ties.
+        # Usually zero or one aircraft is overhead, which needs no sort
+        indices = np.flatnonzero(mask)
+        if len(indices) > 1:
+            indices = indices[np.argsort(distances_sq[indices], kind='stable')]
+
+        return [batch.as_aircraft(i) for i in indices]
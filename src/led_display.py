@@ -2,7 +2,8 @@
 LED display module for flight information.
 Handles displaying flight data on RGB LED matrix.
 """
-from typing import Dict, Any, List, Optional
+from itertools import cycle
+from typing import Dict, Any, Iterator, List, Optional
 from src.utils import Aircraft
 
 # Try to import RGB matrix library (only available on Raspberry Pi)
@@ -16,29 +17,39 @@ except ImportError:
     graphics = None
 
 
+# Country abbreviations mapping; module-level so lookups skip attribute access
+_COUNTRY_ABBREV = {
+    'United Kingdom': 'UK',
+    'United States': 'USA',
+    'Germany': 'DE',
+    'France': 'FR',
+    'Spain': 'ES',
+    'Italy': 'IT',
+    'Netherlands': 'NL',
+    'Belgium': 'BE',
+    'Switzerland': 'CH',
+    'Austria': 'AT',
+    'Canada': 'CA',
+    'Australia': 'AU',
+    'Japan': 'JP',
+    'China': 'CN',
+    'India': 'IN',
+    'Brazil': 'BR',
+}
+
+# (RGBMatrixOptions attribute, display config key, default)
+_MATRIX_OPTIONS = (
+    ('rows', 'led_rows', 32),
+    ('cols', 'led_cols', 64),
+    ('chain_length', 'led_chain', 1),
+    ('parallel', 'led_parallel', 1),
+    ('brightness', 'brightness', 80),
+)
+
+
 class LEDDisplay:
     """LED matrix display controller."""
 
-    # Country abbreviations mapping
-    COUNTRY_ABBREV = {
-        'United Kingdom': 'UK',
-        'United States': 'USA',
-        'Germany': 'DE',
-        'France': 'FR',
-        'Spain': 'ES',
-        'Italy': 'IT',
-        'Netherlands': 'NL',
-        'Belgium': 'BE',
-        'Switzerland': 'CH',
-        'Austria': 'AT',
-        'Canada': 'CA',
-        'Australia': 'AU',
-        'Japan': 'JP',
-        'China': 'CN',
-        'India': 'IN',
-        'Brazil': 'BR',
-    }
-
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize LED display.
@@ -51,8 +62,10 @@ class LEDDisplay:
         self.rotation_seconds = config.get('rotation_seconds', 8)
         self.matrix = None
         self.font = None
+        # Offscreen canvas handed back by SwapOnVSync, reused for every frame
+        self._canvas = None
         self.aircraft_queue: List[Aircraft] = []
-        self.queue_index = 0
+        self._queue_cycle: Optional[Iterator[Aircraft]] = None
 
         # Check if RGB matrix is available
         rgb_available = RGB_MATRIX_AVAILABLE or (RGBMatrix is not None)
@@ -66,11 +79,8 @@ class LEDDisplay:
     def _init_matrix(self) -> None:
         """Initialize RGB matrix hardware."""
         options = RGBMatrixOptions()
-        options.rows = self.config.get('led_rows', 32)
-        options.cols = self.config.get('led_cols', 64)
-        options.chain_length = self.config.get('led_chain', 1)
-        options.parallel = self.config.get('led_parallel', 1)
-        options.brightness = self.config.get('brightness', 80)
+        for attr, key, default in _MATRIX_OPTIONS:
+            setattr(options, attr, self.config.get(key, default))
 
         self.matrix = RGBMatrix(options=options)
 
@@ -90,7 +100,7 @@ class LEDDisplay:
         Returns:
             Abbreviated country name
         """
-        return self.COUNTRY_ABBREV.get(country, country)
+        return _COUNTRY_ABBREV.get(country, country)
 
     def format_flight_info(self, aircraft: Aircraft) -> str:
         """
@@ -126,31 +136,20 @@ class LEDDisplay:
         Args:
             aircraft: Aircraft object to display
         """
+        # Prefer the text cached on the aircraft after enrichment
+        text = aircraft.display_text or self.format_flight_info(aircraft)
+
         if not self.enabled:
             # Print to console for testing
-            print(f"[Display] {self.format_flight_info(aircraft)}")
+            print(f"[Display] {text}")
             return
 
-        # Clear display
-        self.matrix.Clear()
-
-        # Format and display text
-        text = self.format_flight_info(aircraft)
-        lines = text.split('\n')
-
         # Display text (simplified - actual implementation would use graphics library)
         if self.font and graphics:
-            canvas = self.matrix.CreateFrameCanvas()
-            color = graphics.Color(255, 255, 255)  # White
-
-            y_pos = 10
-            for line in lines:
-                graphics.DrawText(canvas, self.font, 2, y_pos, color, line)
-                y_pos += 12
-
-            self.matrix.SwapOnVSync(canvas)
+            self._draw_frame(text.split('\n'), graphics.Color(255, 255, 255))  # White
         else:
             # Fallback if no font loaded
+            self.matrix.Clear()
             print(f"[Display] {text}")
 
     def show_waiting_message(self) -> None:
@@ -160,13 +159,34 @@ class LEDDisplay:
             return
 
         if self.matrix:
-            self.matrix.Clear()
-
             if self.font and graphics:
-                canvas = self.matrix.CreateFrameCanvas()
-                color = graphics.Color(100, 100, 100)  # Gray
-                graphics.DrawText(canvas, self.font, 2, 10, color, "Waiting...")
-                self.matrix.SwapOnVSync(canvas)
+                self._draw_frame(["Waiting..."], graphics.Color(100, 100, 100))  # Gray
+            else:
+                self.matrix.Clear()
+
+    def _draw_frame(self, lines: List[str], color: Any) -> None:
+        """
+        Draw text lines on the offscreen canvas and swap it in.
+
+        The swap replaces the whole frame, so the live matrix is not cleared
+        first; only the offscreen canvas is, which also avoids a blank frame
+        between flights.
+
+        Args:
+            lines: Text lines to draw, top to bottom
+            color: graphics.Color for the text
+        """
+        canvas = self._canvas
+        if canvas is None:
+            canvas = self.matrix.CreateFrameCanvas()
+        canvas.Clear()
+
+        y_pos = 10
+        for line in lines:
+            graphics.DrawText(canvas, self.font, 2, y_pos, color, line)
+            y_pos += 12
+
+        self._canvas = self.matrix.SwapOnVSync(canvas)
 
     def clear(self) -> None:
         """Clear the display."""
@@ -184,7 +204,8 @@ class LEDDisplay:
             aircraft_list: List of aircraft to display
         """
         self.aircraft_queue = aircraft_list
-        self.queue_index = 0
+        # Restart rotation from the first aircraft of the new list
+        self._queue_cycle = cycle(aircraft_list) if aircraft_list else None
 
     def get_next_aircraft(self) -> Optional[Aircraft]:
         """
@@ -193,10 +214,7 @@ class LEDDisplay:
         Returns:
             Next aircraft to display, or None if queue is empty
         """
-        if not self.aircraft_queue:
+        if self._queue_cycle is None:
             return None
 
-        aircraft = self.aircraft_queue[self.queue_index]
-        self.queue_index = (self.queue_index + 1) % len(self.aircraft_queue)
-
-        return aircraft
+        return next(self._queue_cycle)
@@ -1,12 +1,12 @@
 """
 Main application for flight tracker LED display.
 """
-import time
 import logging
+import threading
 from pathlib import Path
 from src.config import Config
 from src.adsb_processor import ADSBProcessor
-from src.geo_filter import GeoFilter
+from src.geo_filter import GeoFilter, warm_up_kernels
 from src.flight_api import FlightAPIClient
 from src.led_display import LEDDisplay
 
@@ -78,13 +78,17 @@ class FlightTracker:
             min_altitude_m=overhead_zone.get('min_altitude_m', 500),
             max_altitude_m=overhead_zone.get('max_altitude_m')
         )
+        # Compile the batch filter kernel now rather than on the first poll
+        warm_up_kernels()
 
         # Initialize flight API client
         self.flight_api = FlightAPIClient(
             provider=api_config.get('provider', 'opensky'),
             api_key=api_config.get('api_key', ''),
             cache_duration=api_config.get('cache_duration', 300),
-            request_timeout=api_config.get('request_timeout', 10)
+            request_timeout=api_config.get('request_timeout', 10),
+            cache_size=api_config.get('cache_size', 10000),
+            rate_limit_delay=api_config.get('rate_limit_delay', 1.0)
         )
 
         # Initialize LED display
@@ -93,60 +97,115 @@ class FlightTracker:
         self.logger.info("All components initialized successfully")
 
     def run(self) -> None:
-        """Run the main application loop."""
+        """
+        Run the main application.
+
+        ADS-B polling runs on the calling thread while display rotation runs
+        on its own thread, so each follows its own interval and a slow fetch
+        or enrichment never stalls the display.
+        """
         self.logger.info("Starting flight tracker main loop")
 
         update_interval = self.config.get('adsb.update_interval', 2)
         rotation_seconds = self.config.get('display.rotation_seconds', 8)
 
-        current_overhead = []
-        last_display_update = time.time()
+        self._stop_event = threading.Event()
+        self._display_wake = threading.Event()
+        self._queue_lock = threading.Lock()
 
-        try:
-            while True:
-                # Fetch aircraft data
-                aircraft_list = self.adsb_processor.fetch_aircraft_data()
-                self.logger.debug(f"Fetched {len(aircraft_list)} aircraft")
-
-                # Filter for overhead aircraft
-                overhead_aircraft = self.geo_filter.filter_overhead_aircraft(aircraft_list)
-                self.logger.debug(f"Found {len(overhead_aircraft)} overhead aircraft")
-
-                if overhead_aircraft:
-                    # Enrich with flight information if new aircraft
-                    for aircraft in overhead_aircraft:
-                        if aircraft.icao not in [a.icao for a in current_overhead]:
-                            self.flight_api.enrich_aircraft(aircraft)
-                            self.logger.info(
-                                f"New overhead aircraft: {aircraft.callsign or aircraft.icao}"
-                            )
-
-                    # Update display queue
-                    self.led_display.update_queue(overhead_aircraft)
-                    current_overhead = overhead_aircraft
-
-                    # Rotate display
-                    if time.time() - last_display_update >= rotation_seconds:
-                        next_aircraft = self.led_display.get_next_aircraft()
-                        if next_aircraft:
-                            self.led_display.show_flight(next_aircraft)
-                            last_display_update = time.time()
-
-                else:
-                    # No aircraft overhead
-                    if current_overhead:
-                        self.logger.info("No aircraft overhead")
-                        current_overhead = []
-
-                    self.led_display.show_waiting_message()
-
-                # Wait before next update
-                time.sleep(update_interval)
+        display_thread = threading.Thread(
+            target=self._display_loop, args=(rotation_seconds,), daemon=True
+        )
+        display_thread.start()
 
+        try:
+            self._fetch_loop(update_interval)
         except KeyboardInterrupt:
             self.logger.info("Shutting down flight tracker")
+            self._stop_event.set()
+            self._display_wake.set()
+            display_thread.join()
             self.shutdown()
 
+    def _fetch_loop(self, update_interval: float) -> None:
+        """
+        Poll ADS-B data and refresh the display queue.
+
+        Args:
+            update_interval: Seconds between polls
+        """
+        current_overhead = {}  # ICAO -> Aircraft overhead on the previous tick
+
+        while not self._stop_event.is_set():
+            # Fetch aircraft data as columns; only overhead hits become Aircraft
+            aircraft_batch = self.adsb_processor.fetch_aircraft_batch()
+            self.logger.debug(f"Fetched {len(aircraft_batch)} aircraft")
+
+            # Filter for overhead aircraft
+            overhead_aircraft = self.geo_filter.filter_overhead_batch(aircraft_batch)
+            self.logger.debug(f"Found {len(overhead_aircraft)} overhead aircraft")
+
+            if overhead_aircraft:
+                # Enrich with flight information if new aircraft
+                new_aircraft = [
+                    aircraft for aircraft in overhead_aircraft
+                    if aircraft.icao not in current_overhead
+                ]
+                self.flight_api.enrich_multiple_aircraft(new_aircraft)
+                for aircraft in new_aircraft:
+                    # Format once; later rotations reuse the cached text
+                    aircraft.display_text = self.led_display.format_flight_info(aircraft)
+                    self.logger.info(
+                        f"New overhead aircraft: {aircraft.callsign or aircraft.icao}"
+                    )
+
+                # Carry cached display text over to this tick's objects
+                for aircraft in overhead_aircraft:
+                    previous = current_overhead.get(aircraft.icao)
+                    if previous is not None:
+                        aircraft.display_text = previous.display_text
+
+                # Only replace the display queue when the set of aircraft
+                # changes, so rotation is not reset on every poll
+                if new_aircraft or len(overhead_aircraft) != len(current_overhead):
+                    with self._queue_lock:
+                        self.led_display.update_queue(overhead_aircraft)
+                    if not current_overhead:
+                        self._display_wake.set()  # Show the first aircraft now
+                current_overhead = {a.icao: a for a in overhead_aircraft}
+
+            elif current_overhead:
+                # No aircraft overhead
+                self.logger.info("No aircraft overhead")
+                current_overhead = {}
+                with self._queue_lock:
+                    self.led_display.update_queue([])
+                self._display_wake.set()
+
+            # Wait before next update
+            self._stop_event.wait(update_interval)
+
+    def _display_loop(self, rotation_seconds: float) -> None:
+        """
+        Rotate through the display queue on a fixed cadence.
+
+        Args:
+            rotation_seconds: Seconds each aircraft stays on the display
+        """
+        while not self._stop_event.is_set():
+            self._display_wake.clear()
+
+            with self._queue_lock:
+                next_aircraft = self.led_display.get_next_aircraft()
+
+            if next_aircraft:
+                self.led_display.show_flight(next_aircraft)
+            else:
+                self.led_display.show_waiting_message()
+
+            # Woken early when the queue goes from empty to non-empty or back
+            self._display_wake.wait(rotation_seconds)
+
     def shutdown(self) -> None:
         """Clean shutdown of the application."""
         self.logger.info("Cleaning up...")
@@ -1,16 +1,32 @@
 """
 Utility functions for the flight tracker system.
 """
-from typing import Dict, Any
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, Optional
+import numpy as np
 
 
 class Aircraft:
     """Represents an aircraft with its current state."""
 
+    # Hundreds are built per poll; slots drop the per-instance __dict__
+    __slots__ = (
+        'icao', 'icao_lower', 'callsign', 'latitude', 'longitude', 'altitude',
+        'velocity', 'track', 'vertical_rate', 'last_seen', 'has_pos',
+        'flight_number', 'origin_country', 'destination_country',
+        'origin_airport', 'destination_airport', 'display_text',
+    )
+
     def __init__(self, icao: str, data: Dict[str, Any]):
         self.icao = icao
+        self.icao_lower = icao.lower()  # OpenSky expects lowercase icao24
         # ADS-B data uses 'flight' field, but also support 'callsign'
-        callsign = data.get('flight', data.get('callsign', ''))
+        # (fallback looked up only when 'flight' is absent)
+        callsign = data.get('flight')
+        if callsign is None:
+            callsign = data.get('callsign')
+        # str.strip() returns the same object when there is nothing to strip
         self.callsign = callsign.strip() if callsign else ''
         self.latitude = data.get('lat')
         self.longitude = data.get('lon')
@@ -19,6 +35,10 @@ class Aircraft:
         self.track = data.get('track')  # Heading in degrees
         self.vertical_rate = data.get('baro_rate')  # ft/min
         self.last_seen = data.get('seen', 0)  # Seconds since last message
+        # Computed once: positions may move after parse but never appear or vanish
+        self.has_pos = (self.latitude is not None and
+                        self.longitude is not None and
+                        self.altitude is not None)
 
         # Flight information (to be filled by API)
         self.flight_number = None
@@ -27,12 +47,86 @@ class Aircraft:
         self.origin_airport = None
         self.destination_airport = None
 
+        # Formatted LED text, cached once enrichment is done
+        self.display_text: Optional[str] = None
+
     def has_position(self) -> bool:
         """Check if aircraft has valid position data."""
-        return (self.latitude is not None and
-                self.longitude is not None and
-                self.altitude is not None)
+        return self.has_pos
 
     def __repr__(self) -> str:
         return (f"Aircraft(icao={self.icao}, callsign={self.callsign}, "
                 f"lat={self.latitude}, lon={self.longitude}, alt={self.altitude})")
+
+
+# ADS-B positions carry well under 1e-5 degree precision and altitudes are
+# whole feet, so single precision halves the bytes moved per filter pass
+COLUMN_DTYPE = np.float32
+
+# Mean Earth radius used by every distance calculation
+EARTH_RADIUS_KM = 6371.0
+EARTH_RADIUS_KM_SQ = EARTH_RADIUS_KM * EARTH_RADIUS_KM
+
+
+def _float_column(values: Iterable[Any], count: int) -> np.ndarray:
+    """Build a float column, mapping missing or non-numeric values to NaN."""
+    return np.fromiter(
+        (v if isinstance(v, (int, float)) else math.nan for v in values),
+        dtype=COLUMN_DTYPE, count=count
+    )
+
+
+@dataclass
+class AircraftBatch:
+    """
+    Column-oriented (struct-of-arrays) view of a set of aircraft.
+
+    Positions and altitudes are held in contiguous NumPy arrays so
+    filters run as vectorized operations. Aircraft objects are only created
+    on demand from the parallel ``sources`` list of raw ADS-B records.
+    """
+    lats: np.ndarray
+    lons: np.ndarray
+    alts: np.ndarray  # Barometric altitude in feet
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    @classmethod
+    def empty(cls) -> 'AircraftBatch':
+        """Create an empty batch."""
+        return cls.from_records([])
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'AircraftBatch':
+        """
+        Build a batch from raw ADS-B aircraft records.
+
+        Args:
+            records: Iterable of raw aircraft data dictionaries
+
+        Returns:
+            AircraftBatch over the records
+        """
+        records = records if isinstance(records, list) else list(records)
+        count = len(records)
+        return cls(
+            lats=_float_column((r.get('lat') for r in records), count),
+            lons=_float_column((r.get('lon') for r in records), count),
+            alts=_float_column((r.get('alt_baro') for r in records), count),
+            sources=records
+        )
+
+    def as_aircraft(self, index: int) -> Aircraft:
+        """
+        Materialize a single entry as an Aircraft object.
+
+        Args:
+            index: Position in the batch
+
+        Returns:
+            Aircraft object
+        """
+        source = self.sources[index]
+        return Aircraft(icao=source.get('hex', ''), data=source)
@@ -4,6 +4,7 @@ Following TDD: Write tests first, then implement.
 """
 import pytest
 import json
+import numpy as np
 from unittest.mock import Mock, patch, mock_open
 from src.adsb_processor import ADSBProcessor
 from src.utils import Aircraft
@@ -27,12 +28,12 @@ class TestADSBProcessor:
         assert processor.data_source == "http://custom:9090/data.json"
         assert processor.max_age == 60
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_aircraft_data_http_success(self, mock_get):
         """Test successful HTTP fetch of aircraft data."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'aircraft': [
                 {
                     'hex': 'abc123',
@@ -45,7 +46,7 @@ class TestADSBProcessor:
                     'seen': 2
                 }
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         processor = ADSBProcessor(data_source="http://localhost:8080/data/aircraft.json")
@@ -56,7 +57,7 @@ class TestADSBProcessor:
         assert aircraft_list[0].callsign == 'BA142'
         assert aircraft_list[0].latitude == 51.5
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_aircraft_data_http_error(self, mock_get):
         """Test HTTP fetch with connection error."""
         mock_get.side_effect = Exception("Connection error")
@@ -89,6 +90,22 @@ class TestADSBProcessor:
             assert aircraft_list[0].icao == 'def456'
             assert aircraft_list[0].callsign == 'LH789'
 
+    def test_fetch_aircraft_data_ndjson_source(self):
+        """Test streaming aircraft records from an ndjson feed."""
+        ndjson_data = "\n".join([
+            json.dumps({'hex': 'aaa111', 'flight': 'QFA1', 'lat': -37.8, 'lon': 144.9, 'seen': 1}),
+            "",
+            json.dumps({'hex': 'bbb222', 'flight': 'VOZ2', 'lat': -37.7, 'lon': 144.8, 'seen': 90}),
+            json.dumps({'aircraft': [{'hex': 'ccc333', 'seen': 2}]}),
+        ]) + "\n"
+
+        with patch('builtins.open', mock_open(read_data=ndjson_data)):
+            processor = ADSBProcessor(data_source="/path/to/aircraft.ndjson", max_age=30)
+            aircraft_list = processor.fetch_aircraft_data()
+
+            assert [a.icao for a in aircraft_list] == ['aaa111', 'ccc333']
+            assert aircraft_list[0].callsign == 'QFA1'
+
     def test_fetch_aircraft_data_file_not_found(self):
         """Test file source with missing file."""
         with patch('builtins.open', side_effect=FileNotFoundError):
@@ -168,18 +185,18 @@ class TestADSBProcessor:
 
         assert len(filtered) == 1  # Should include aircraft with seen=0
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_aircraft_data_filters_old_aircraft(self, mock_get):
         """Test that fetch_aircraft_data automatically filters old aircraft."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'aircraft': [
                 {'hex': 'new1', 'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000, 'seen': 5},
                 {'hex': 'old1', 'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000, 'seen': 100},
                 {'hex': 'new2', 'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000, 'seen': 1},
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         processor = ADSBProcessor(
@@ -192,12 +209,49 @@ class TestADSBProcessor:
         assert aircraft_list[0].icao == 'new1'
         assert aircraft_list[1].icao == 'new2'
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_fetch_aircraft_batch(self, mock_get):
+        """Test fetching aircraft as a column-oriented batch."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            'aircraft': [
+                {'hex': 'new1', 'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000, 'seen': 5},
+                {'hex': 'old1', 'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000, 'seen': 100},
+                {'hex': 'gnd1', 'lat': 51.4, 'alt_baro': 'ground'},
+            ]
+        }).encode()
+        mock_get.return_value = mock_response
+
+        processor = ADSBProcessor(
+            data_source="http://localhost:8080/data/aircraft.json",
+            max_age=30
+        )
+        batch = processor.fetch_aircraft_batch()
+
+        assert len(batch) == 2
+        assert [batch.as_aircraft(i).icao for i in range(len(batch))] == ['new1', 'gnd1']
+        assert batch.lats[0] == 51.5
+        assert np.isnan(batch.lons[1])
+        assert np.isnan(batch.alts[1])
+        assert batch.as_aircraft(0).icao == 'new1'
+
+    @patch('requests.Session.get')
+    def test_fetch_aircraft_batch_error(self, mock_get):
+        """Test batch fetch returns an empty batch on errors."""
+        mock_get.side_effect = Exception("Connection error")
+
+        processor = ADSBProcessor(data_source="http://localhost:8080/data/aircraft.json")
+        batch = processor.fetch_aircraft_batch()
+
+        assert len(batch) == 0
+
+    @patch('requests.Session.get')
     def test_fetch_aircraft_data_empty_response(self, mock_get):
         """Test handling of empty aircraft list in response."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'aircraft': []}
+        mock_response.content = json.dumps({'aircraft': []}).encode()
         mock_get.return_value = mock_response
 
         processor = ADSBProcessor(data_source="http://localhost:8080/data/aircraft.json")
@@ -205,12 +259,12 @@ class TestADSBProcessor:
 
         assert aircraft_list == []
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_fetch_aircraft_data_malformed_json(self, mock_get):
         """Test handling of malformed JSON response."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("error", "doc", 0)
+        mock_response.content = b'{"aircraft": ['
         mock_get.return_value = mock_response
 
         processor = ADSBProcessor(data_source="http://localhost:8080/data/aircraft.json")
@@ -3,6 +3,7 @@ Tests for configuration module.
 Following TDD: Write tests first, then implement.
 """
 import pytest
+import yaml
 from pathlib import Path
 from unittest.mock import patch, mock_open
 from src.config import Config
@@ -89,6 +90,10 @@ display:
             assert display['brightness'] == 90
             assert display['enabled'] is True
 
+            with pytest.raises(TypeError):
+                display['brightness'] = 10
+            assert config.get('display.brightness') == 90
+
     def test_get_api_config(self):
         """Test getting API configuration."""
         yaml_content = """
@@ -206,3 +211,55 @@ location:
         with patch('builtins.open', mock_open(read_data=yaml_content_2)):
             config.reload()
             assert config.location['latitude'] == 40.7128
+
+    def test_get_section_and_reload(self):
+        """Test dot-path lookups return sections and track reloads."""
+        yaml_content_1 = """
+location:
+  latitude: 51.5074
+"""
+        yaml_content_2 = """
+location:
+  latitude: 40.7128
+"""
+        with patch('builtins.open', mock_open(read_data=yaml_content_1)):
+            config = Config('test.yaml')
+            assert config.get('location') == {'latitude': 51.5074}
+            assert config.get('location.latitude') == 51.5074
+
+        with patch('builtins.open', mock_open(read_data=yaml_content_2)):
+            config.reload()
+            assert config.get('location.latitude') == 40.7128
+
+    def test_reload_skips_unchanged_file(self, tmp_path):
+        """Test reload only re-parses when the file has changed."""
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text("location:\n  latitude: 51.5074\n")
+        config = Config(str(config_file))
+
+        with patch('src.config.yaml.load') as mock_load:
+            config.reload()
+            mock_load.assert_not_called()
+
+        config_file.write_text("location:\n  latitude: 40.7128\n  longitude: -74.006\n")
+        config.reload()
+        assert config.get('location.latitude') == 40.7128
+
+    def test_parse_cache_shared_between_instances(self, tmp_path):
+        """Test configs for the same unchanged file share one parse."""
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text("location:\n  latitude: 51.5074\n")
+        Config.invalidate_cache()
+
+        with patch('src.config.yaml.load', wraps=yaml.load) as mock_load:
+            first = Config(str(config_file))
+            second = Config(str(config_file))
+            assert mock_load.call_count == 1
+
+            Config.invalidate_cache()
+            Config(str(config_file))
+            assert mock_load.call_count == 2
+
+        # Each instance gets its own copy of the data
+        first.config_data['location']['latitude'] = 0.0
+        assert second.config_data['location']['latitude'] == 51.5074
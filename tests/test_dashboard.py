@@ -6,75 +6,79 @@ import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
 from src.dashboard import FlightTrackerDashboard
+from src.utils import Aircraft
+
+# Values served by the mocked Config.get()
+CONFIG_VALUES = {
+    'location.latitude': -37.7964,
+    'location.longitude': 144.9008,
+    'overhead_zone.radius_km': 3.0,
+    'overhead_zone.min_altitude_m': 500,
+    'overhead_zone.max_altitude_m': 12000,
+    'api.provider': 'opensky',
+    'api.cache_duration': 300,
+    'adsb.data_source': 'http://localhost:8080/data/aircraft.json',
+    'adsb.update_interval': 5,
+    'dashboard.recent_max': 5,
+}
+
+
+def _mock_config():
+    """Build a mocked Config instance for the dashboard."""
+    mock_config_instance = MagicMock()
+    mock_config_instance.get_location.return_value = {
+        'latitude': -37.7964,
+        'longitude': 144.9008
+    }
+    mock_config_instance.get_overhead_zone.return_value = {
+        'radius_km': 3.0,
+        'min_altitude_m': 500,
+        'max_altitude_m': 12000
+    }
+    mock_config_instance.get_adsb_config.return_value = {
+        'data_source': 'http://localhost:8080/data/aircraft.json',
+        'max_age': 30
+    }
+    mock_config_instance.get_api_config.return_value = {
+        'provider': 'opensky',
+        'api_key': '',
+        'cache_duration': 300
+    }
+    mock_config_instance.get.side_effect = (
+        lambda key, default=None: CONFIG_VALUES.get(key, default)
+    )
+    return mock_config_instance
+
+
+def _build_dashboard():
+    """Build a dashboard backed by the mocked configuration."""
+    with patch('src.dashboard.Config', return_value=_mock_config()):
+        return FlightTrackerDashboard('test_config.yaml')
+
+
+@pytest.fixture(scope="module")
+def dashboard():
+    """Dashboard shared by the tests that only read from it."""
+    return _build_dashboard()
+
+
+@pytest.fixture
+def fresh_dashboard():
+    """Dashboard for tests that mutate its state."""
+    return _build_dashboard()
 
 
 class TestFlightTrackerDashboard:
     """Test suite for FlightTrackerDashboard class."""
 
-    @patch('src.dashboard.Config')
-    def test_dashboard_initialization(self, mock_config):
+    def test_dashboard_initialization(self, dashboard):
         """Test dashboard initialization."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0,
-            'min_altitude_m': 500,
-            'max_altitude_m': 12000
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json',
-            'max_age': 30
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky',
-            'api_key': '',
-            'cache_duration': 300
-        }
-        mock_config_instance.get.return_value = 5
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         assert dashboard.app is not None
         assert dashboard.config is not None
         assert dashboard.stats['total_aircraft_seen'] == 0
 
-    @patch('src.dashboard.Config')
-    def test_status_endpoint(self, mock_config):
+    def test_status_endpoint(self, dashboard):
         """Test /api/status endpoint."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0,
-            'min_altitude_m': 500,
-            'max_altitude_m': 12000
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json',
-            'max_age': 30
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky',
-            'api_key': '',
-            'cache_duration': 300
-        }
-        mock_config_instance.get.side_effect = lambda key, default=None: {
-            'location.latitude': -37.7964,
-            'location.longitude': 144.9008,
-            'overhead_zone.radius_km': 3.0,
-            'overhead_zone.min_altitude_m': 500,
-            'overhead_zone.max_altitude_m': 12000
-        }.get(key, default)
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         with dashboard.app.test_client() as client:
             response = client.get('/api/status')
             assert response.status_code == 200
@@ -84,28 +88,8 @@ class TestFlightTrackerDashboard:
             assert 'uptime_seconds' in data
             assert data['location']['latitude'] == -37.7964
 
-    @patch('src.dashboard.Config')
-    def test_stats_endpoint(self, mock_config):
+    def test_stats_endpoint(self, dashboard):
         """Test /api/stats endpoint."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json'
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky'
-        }
-        mock_config_instance.get.return_value = 5
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         with dashboard.app.test_client() as client:
             response = client.get('/api/stats')
             assert response.status_code == 200
@@ -114,28 +98,8 @@ class TestFlightTrackerDashboard:
             assert 'total_aircraft_seen' in data
             assert 'overhead_aircraft_count' in data
 
-    @patch('src.dashboard.Config')
-    def test_aircraft_endpoint(self, mock_config):
+    def test_aircraft_endpoint(self, dashboard):
         """Test /api/aircraft endpoint."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json'
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky'
-        }
-        mock_config_instance.get.return_value = 5
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         with dashboard.app.test_client() as client:
             response = client.get('/api/aircraft')
             assert response.status_code == 200
@@ -145,33 +109,8 @@ class TestFlightTrackerDashboard:
             assert 'overhead' in data
             assert 'aircraft' in data
 
-    @patch('src.dashboard.Config')
-    def test_config_endpoint(self, mock_config):
+    def test_config_endpoint(self, dashboard):
         """Test /api/config endpoint."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json'
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky'
-        }
-        mock_config_instance.get.side_effect = lambda key, default=None: {
-            'api.provider': 'opensky',
-            'api.cache_duration': 300,
-            'adsb.data_source': 'http://localhost:8080/data/aircraft.json',
-            'adsb.update_interval': 5
-        }.get(key, default)
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         with dashboard.app.test_client() as client:
             response = client.get('/api/config')
             assert response.status_code == 200
@@ -181,30 +120,8 @@ class TestFlightTrackerDashboard:
             assert 'overhead_zone' in data
             assert 'api' in data
 
-    @patch('src.dashboard.Config')
-    def test_aircraft_to_dict(self, mock_config):
+    def test_aircraft_to_dict(self, dashboard):
         """Test aircraft conversion to dictionary."""
-        from src.utils import Aircraft
-
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json'
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky'
-        }
-        mock_config_instance.get.return_value = 5
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         aircraft = Aircraft('abc123', {
             'flight': 'TEST123',
             'lat': -37.80,
@@ -213,36 +130,122 @@ class TestFlightTrackerDashboard:
             'gs': 250
         })
 
-        aircraft_dict = dashboard._aircraft_to_dict(aircraft)
+        aircraft_dict = dashboard._aircraft_to_dicts([aircraft])[0]
 
         assert aircraft_dict['icao'] == 'abc123'
         assert aircraft_dict['callsign'] == 'TEST123'
         assert aircraft_dict['latitude'] == -37.80
         assert 'distance_km' in aircraft_dict
 
-    @patch('src.dashboard.Config')
-    def test_format_uptime(self, mock_config):
+    def test_format_uptime(self, dashboard):
         """Test uptime formatting."""
-        mock_config_instance = MagicMock()
-        mock_config.return_value = mock_config_instance
-        mock_config_instance.get_location.return_value = {
-            'latitude': -37.7964,
-            'longitude': 144.9008
-        }
-        mock_config_instance.get_overhead_zone.return_value = {
-            'radius_km': 3.0
-        }
-        mock_config_instance.get_adsb_config.return_value = {
-            'data_source': 'http://localhost:8080/data/aircraft.json'
-        }
-        mock_config_instance.get_api_config.return_value = {
-            'provider': 'opensky'
-        }
-        mock_config_instance.get.return_value = 5
-
-        dashboard = FlightTrackerDashboard('test_config.yaml')
-
         formatted = dashboard._format_uptime(3665)  # 1h 1m 5s
         assert 'h' in formatted
         assert 'm' in formatted
         assert 's' in formatted
+        assert formatted == '1h 1m 5s'
+        assert dashboard._format_uptime(59.9) == '0h 0m 59s'
+
+        assert dashboard._cached_uptime_text(3665) == formatted
+        with patch.object(dashboard, '_format_uptime') as mock_format:
+            assert dashboard._cached_uptime_text(3665) == formatted
+            mock_format.assert_not_called()
+
+    def test_aircraft_to_dicts_batch_distance(self, dashboard):
+        """Test batch conversion computes the same distances as the scalar calculation."""
+        aircraft_list = [
+            Aircraft('abc123', {'lat': -37.80, 'lon': 144.90, 'alt_baro': 5000}),
+            Aircraft('def456', {'alt_baro': 5000}),
+            Aircraft('ghi789', {'lat': 0.0, 'lon': 0.0, 'alt_baro': 5000}),
+        ]
+
+        dicts = dashboard._aircraft_to_dicts(aircraft_list)
+
+        assert dicts[0]['distance_km'] == round(
+            dashboard.geo_filter.calculate_distance(-37.80, 144.90), 2)
+        assert dicts[1]['distance_km'] is None
+        assert dicts[1]['icao'] == 'def456'
+        # A zero coordinate is still a position
+        assert dicts[2]['distance_km'] == round(
+            dashboard.geo_filter.calculate_distance(0.0, 0.0), 2)
+
+    def test_publish_payloads_converts_separate_overhead_objects(self, fresh_dashboard):
+        """Test overhead aircraft not in the main list are still serialized."""
+        dashboard = fresh_dashboard
+        tracked = Aircraft('abc123', {'lat': -37.80, 'lon': 144.90, 'alt_baro': 5000})
+        separate = Aircraft('def456', {'lat': -37.7964, 'lon': 144.9008, 'alt_baro': 3000})
+
+        dashboard._publish_aircraft_payloads([tracked], [separate, tracked])
+
+        data = json.loads(dashboard._overhead_json)
+        assert [a['icao'] for a in data['aircraft']] == ['def456', 'abc123']
+        assert data['aircraft'][0]['distance_km'] == 0.0
+        assert data['aircraft'][1] == json.loads(dashboard._aircraft_json)['aircraft'][0]
+
+    def test_recent_flights_bounded(self, fresh_dashboard):
+        """Test recent flights evict oldest entries and keep the ICAO index in sync."""
+        dashboard = fresh_dashboard
+        maxlen = dashboard.recent_flights.maxlen
+
+        with dashboard._lock:
+            for i in range(maxlen + 3):
+                dashboard._add_recent_flight({'icao': f'ICAO{i}'})
+
+        assert len(dashboard.recent_flights) == maxlen
+        assert 'ICAO0' not in dashboard._recent_icaos
+        assert f'ICAO{maxlen + 2}' in dashboard._recent_icaos
+        assert len(dashboard._recent_icaos) == maxlen
+
+        with dashboard.app.test_client() as client:
+            data = json.loads(client.get('/api/recent').data)
+            assert len(data['flights']) == min(20, maxlen)
+            assert data['flights'][-1]['icao'] == f'ICAO{maxlen + 2}'
+
+    def test_update_skips_flights_recorded_by_overlapping_update(self, fresh_dashboard):
+        """Test an ICAO recorded while enrichment ran is not appended twice."""
+        dashboard = fresh_dashboard
+        aircraft = Aircraft('abc123', {'lat': -37.7964, 'lon': 144.9008, 'alt_baro': 3000})
+        dashboard.adsb_processor.fetch_aircraft_data = Mock(return_value=[aircraft])
+        dashboard.geo_filter.filter_overhead_aircraft = Mock(return_value=[aircraft])
+
+        def overlapping_update(new_overhead):
+            # Another update records the same aircraft before this one locks
+            with dashboard._lock:
+                dashboard._add_recent_flight({'icao': 'abc123'})
+            return 0
+
+        dashboard.flight_api.enrich_multiple_aircraft = Mock(side_effect=overlapping_update)
+        dashboard._update_data()
+
+        assert [f['icao'] for f in dashboard.recent_flights] == ['abc123']
+        assert dashboard.stats['errors'] == 0
+
+    def test_aircraft_payloads_published_on_update(self, fresh_dashboard):
+        """Test /api/aircraft and /api/overhead serve payloads built by _update_data."""
+        dashboard = fresh_dashboard
+
+        with dashboard.app.test_client() as client:
+            data = json.loads(client.get('/api/aircraft').data)
+            assert data == {'total': 0, 'overhead': 0, 'aircraft': []}
+
+        aircraft = Aircraft('abc123', {'lat': -37.7964, 'lon': 144.9008, 'alt_baro': 3000})
+        dashboard.adsb_processor.fetch_aircraft_data = Mock(return_value=[aircraft])
+        dashboard.geo_filter.filter_overhead_aircraft = Mock(return_value=[aircraft])
+        dashboard.flight_api.enrich_multiple_aircraft = Mock(return_value=1)
+
+        with patch.object(dashboard, '_aircraft_to_dicts',
+                          wraps=dashboard._aircraft_to_dicts) as to_dicts:
+            dashboard._update_data()
+        # Overhead dicts are reused from the all-aircraft conversion
+        to_dicts.assert_called_once_with([aircraft])
+        assert dashboard.stats['api_calls'] == 1
+
+        with dashboard.app.test_client() as client:
+            data = json.loads(client.get('/api/aircraft').data)
+            assert data['total'] == 1
+            assert data['overhead'] == 1
+            assert data['aircraft'][0]['icao'] == 'abc123'
+
+            data = json.loads(client.get('/api/overhead').data)
+            assert data['count'] == 1
+            assert data['aircraft'][0]['distance_km'] == 0.0
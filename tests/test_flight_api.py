@@ -3,12 +3,22 @@ Tests for flight API module.
 Following TDD: Write tests first, then implement.
 """
 import pytest
+import json
+import requests
 import time
 from unittest.mock import Mock, patch, mock_open
 from src.flight_api import FlightAPIClient
 from src.utils import Aircraft
 
 
+@pytest.fixture(autouse=True)
+def fresh_airport_cache():
+    """Keep the shared airport database from leaking between tests."""
+    FlightAPIClient.invalidate_airport_cache()
+    yield
+    FlightAPIClient.invalidate_airport_cache()
+
+
 class TestFlightAPIClient:
     """Test suite for FlightAPIClient class."""
 
@@ -33,12 +43,12 @@ class TestFlightAPIClient:
         assert client.cache_duration == 600
         assert client.request_timeout == 20
 
-    @patch('src.flight_api.requests.get')
+    @patch('src.flight_api.requests.Session.get')
     def test_enrich_aircraft_opensky_success(self, mock_get):
         """Test successful flight data enrichment using OpenSky API."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'states': [[
                 'abc123',  # icao24
                 'BAW123  ',  # callsign
@@ -47,7 +57,7 @@ class TestFlightAPIClient:
                 None, None, None, None, None, None,
                 None, None, None, None
             ]]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         client = FlightAPIClient(provider="opensky")
@@ -57,12 +67,26 @@ class TestFlightAPIClient:
 
         assert aircraft.origin_country == 'United Kingdom'
 
-    @patch('src.flight_api.requests.get')
+    @patch('src.flight_api.requests.Session.get')
+    def test_enrich_aircraft_opensky_lowercases_icao(self, mock_get):
+        """Test the OpenSky lookup URL uses the lowercase ICAO."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({'states': None}).encode()
+        mock_get.return_value = mock_response
+
+        client = FlightAPIClient(provider="opensky")
+        aircraft = Aircraft('ABC123', {'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000})
+
+        client.enrich_aircraft(aircraft)
+
+        assert mock_get.call_args[0][0].endswith('icao24=abc123')
+
+    @patch('src.flight_api.requests.Session.get')
     def test_enrich_aircraft_opensky_no_data(self, mock_get):
         """Test OpenSky API with no matching data."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'states': None}
+        mock_response.content = json.dumps({'states': None}).encode()
         mock_get.return_value = mock_response
 
         client = FlightAPIClient(provider="opensky")
@@ -72,7 +96,7 @@ class TestFlightAPIClient:
 
         assert aircraft.origin_country is None
 
-    @patch('src.flight_api.requests.get')
+    @patch('src.flight_api.requests.Session.get')
     def test_enrich_aircraft_api_error(self, mock_get):
         """Test handling of API request errors."""
         mock_get.side_effect = Exception("API Error")
@@ -102,18 +126,30 @@ class TestFlightAPIClient:
 
     def test_cache_expiry(self):
         """Test cache expiration."""
-        client = FlightAPIClient(cache_duration=1)  # 1 second cache
+        clock = [1000.0]
+        with patch('src.flight_api.time.monotonic', side_effect=lambda: clock[0]):
+            client = FlightAPIClient(cache_duration=1)  # 1 second cache
+            client._cache_data('abc123', {'origin_country': 'United Kingdom'})
+            assert client._is_cached('abc123') is True
 
-        # Add old cache entry
-        client._cache['abc123'] = {
-            'origin_country': 'United Kingdom',
-            'timestamp': time.time() - 10  # 10 seconds ago
-        }
+            clock[0] += 10  # 10 seconds later
+
+            # Should be expired
+            assert client._is_cached('abc123') is False
+            assert client._get_cached_data('abc123') == {}
+
+    def test_cache_is_bounded(self):
+        """Test the cache evicts entries beyond its capacity."""
+        client = FlightAPIClient(cache_size=3)
 
-        # Should be expired
-        assert client._is_cached('abc123') is False
+        for i in range(5):
+            client._cache_data(f'{i:06x}', {'origin_country': 'Australia'})
 
-    @patch('src.flight_api.requests.get')
+        assert len(client._cache) == 3
+        assert not client._is_cached('000000')  # Oldest entries evicted
+        assert client._is_cached('000004')
+
+    @patch('src.flight_api.requests.Session.get')
     def test_enrich_aircraft_uses_cache(self, mock_get):
         """Test that cached data is used instead of making API calls."""
         client = FlightAPIClient(provider="opensky")
@@ -125,7 +161,7 @@ class TestFlightAPIClient:
         }
 
         aircraft = Aircraft('abc123', {'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000})
-        client.enrich_aircraft(aircraft)
+        assert client.enrich_aircraft(aircraft) == 0
 
         # Should use cached data, not make API call
         mock_get.assert_not_called()
@@ -148,6 +184,25 @@ class TestFlightAPIClient:
 
         assert db == {}
 
+    def test_get_airport(self):
+        """Test looking up a single airport record."""
+        client = FlightAPIClient()
+
+        airport = client.get_airport('LHR')
+        assert airport['country'] == 'United Kingdom'
+        assert isinstance(airport, dict)
+        assert client.get_airport('XXX') is None
+
+    def test_airport_database_shared_between_clients(self):
+        """Test the airport database is read from disk only once."""
+        first = FlightAPIClient()
+
+        with patch.object(FlightAPIClient, '_load_airport_database') as mock_load:
+            second = FlightAPIClient()
+            mock_load.assert_not_called()
+
+        assert second._airport_db is first._airport_db
+
     def test_extract_airport_from_callsign(self):
         """Test extracting airport codes from callsigns."""
         client = FlightAPIClient()
@@ -164,14 +219,14 @@ class TestFlightAPIClient:
         result = client._parse_route_from_callsign('TEST123')
         assert result is None or isinstance(result, dict)
 
-    @patch('src.flight_api.requests.get')
+    @patch('src.flight_api.requests.Session.get')
     def test_rate_limiting(self, mock_get):
         """Test rate limiting between API requests."""
         client = FlightAPIClient(provider="opensky")
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'states': None}
+        mock_response.content = json.dumps({'states': None}).encode()
         mock_get.return_value = mock_response
 
         aircraft1 = Aircraft('abc123', {'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000})
@@ -186,6 +241,36 @@ class TestFlightAPIClient:
         # Note: This test might be flaky depending on system performance
         assert elapsed >= 0  # At minimum, just check it completes
 
+    def test_rate_limiter_token_bucket(self):
+        """Test the token bucket spaces requests on the monotonic clock."""
+        from src.flight_api import _RateLimiter
+
+        clock = [100.0]
+        with patch('src.flight_api.time.monotonic', side_effect=lambda: clock[0]), \
+                patch('src.flight_api.time.sleep') as mock_sleep:
+            limiter = _RateLimiter(rate=2.0)  # One request every 0.5s
+
+            limiter.acquire()
+            mock_sleep.assert_not_called()  # Bucket starts full
+
+            limiter.acquire()
+            mock_sleep.assert_called_once_with(0.5)
+
+            clock[0] += 10.0  # Idle time refills only up to capacity
+            mock_sleep.reset_mock()
+            limiter.acquire()
+            limiter.acquire()
+            mock_sleep.assert_called_once_with(0.5)
+
+    def test_session_retries_leave_429_to_rate_limiter(self):
+        """Test adapter retries skip 429s and ignore Retry-After."""
+        client = FlightAPIClient()
+        retry = client._session.get_adapter('https://opensky-network.org').max_retries
+
+        assert 429 not in retry.status_forcelist
+        assert 503 in retry.status_forcelist
+        assert retry.respect_retry_after_header is False
+
     def test_enrich_multiple_aircraft(self):
         """Test enriching multiple aircraft."""
         client = FlightAPIClient(provider="opensky")
@@ -196,10 +281,10 @@ class TestFlightAPIClient:
         ]
 
         # Should not raise exception
-        with patch('src.flight_api.requests.get') as mock_get:
+        with patch('src.flight_api.requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {'states': None}
+            mock_response.content = json.dumps({'states': None}).encode()
             mock_get.return_value = mock_response
 
             client.enrich_multiple_aircraft(aircraft_list)
@@ -215,3 +300,61 @@ class TestFlightAPIClient:
         # Should handle gracefully
         client.enrich_aircraft(aircraft)
         assert aircraft.origin_country is None
+
+    def test_enrich_multiple_aircraft_batched(self):
+        """Test uncached aircraft are looked up in a single OpenSky request."""
+        client = FlightAPIClient(provider="opensky")
+        client._rate_limit = Mock()
+        client._cache_data('abc123', {'origin_country': 'Cached Country'})
+
+        aircraft_list = [
+            Aircraft(icao, {'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000})
+            for icao in ('abc123', 'DEF456', 'fed789', '0a0b0c')
+        ]
+
+        mock_response = Mock()
+        mock_response.content = json.dumps({'states': [
+            ['fed789', 'CS', 'Country fed789'],
+            ['def456', 'CS', 'Country def456'],
+        ]}).encode()
+
+        with patch('src.flight_api.requests.Session.get', return_value=mock_response) as mock_get:
+            requests_made = client.enrich_multiple_aircraft(aircraft_list)
+
+        mock_get.assert_called_once()
+        assert requests_made == 1
+        assert mock_get.call_args.kwargs['params'] == [
+            ('icao24', 'def456'), ('icao24', 'fed789'), ('icao24', '0a0b0c')
+        ]
+        assert [a.origin_country for a in aircraft_list] == [
+            'Cached Country', 'Country def456', 'Country fed789', None
+        ]
+        assert client._is_cached('DEF456')
+        assert client._rate_limit.call_count == 1
+
+    def test_enrich_multiple_aircraft_batch_fallback(self):
+        """Test a failed batch request falls back to concurrent single lookups."""
+        client = FlightAPIClient(provider="opensky", max_concurrent_requests=3)
+        client._rate_limit = Mock()
+
+        aircraft_list = [
+            Aircraft(icao, {'lat': 51.5, 'lon': -0.1, 'alt_baro': 5000})
+            for icao in ('abc123', 'def456', 'fed789')
+        ]
+
+        def fake_get(url, params=None, timeout=None):
+            if params is not None:
+                raise requests.ConnectionError("batch unavailable")
+            response = Mock()
+            icao = url.rsplit('=', 1)[1]
+            response.content = json.dumps({'states': [[icao, 'CS', f"Country {icao}"]]}).encode()
+            return response
+
+        with patch('src.flight_api.requests.Session.get', side_effect=fake_get):
+            requests_made = client.enrich_multiple_aircraft(aircraft_list)
+
+        assert [a.origin_country for a in aircraft_list] == [
+            'Country abc123', 'Country def456', 'Country fed789'
+        ]
+        assert client._rate_limit.call_count == 4  # Failed batch + 3 single lookups
+        assert requests_made == 4
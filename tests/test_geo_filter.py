@@ -3,8 +3,9 @@ Tests for geographic filtering module.
 Following TDD: Write tests first, then implement.
 """
 import pytest
+import numpy as np
 from src.geo_filter import GeoFilter
-from src.utils import Aircraft
+from src.utils import Aircraft, AircraftBatch
 
 
 class TestGeoFilter:
@@ -28,6 +29,55 @@ class TestGeoFilter:
         distance = geo_filter.calculate_distance(51.5074, 0.1278)  # Just east of London
         assert 15 < distance < 25  # Approximately 20 km
 
+    def test_batch_distance_matches_scalar(self):
+        """Test vectorized distances agree with the scalar calculation."""
+        geo_filter = GeoFilter(latitude=51.5074, longitude=-0.1278)
+        lats = np.array([51.5074, 48.8566, 51.5074, np.nan])
+        lons = np.array([-0.1278, 2.3522, 0.1278, 0.0])
+
+        distances = geo_filter.batch_distance(lats, lons)
+
+        for i in range(3):
+            expected = geo_filter.calculate_distance(lats[i], lons[i])
+            assert abs(distances[i] - expected) < 1e-9
+        assert np.isnan(distances[3])
+
+    def test_calculate_distance_without_numba(self, monkeypatch):
+        """Test the pure-Python fallback agrees with the compiled kernel."""
+        import src.geo_filter as geo_filter_module
+
+        geo_filter = GeoFilter(latitude=51.5074, longitude=-0.1278)
+        expected = geo_filter.calculate_distance(48.8566, 2.3522)
+
+        monkeypatch.setattr(geo_filter_module, 'NUMBA_AVAILABLE', False)
+        assert abs(geo_filter.calculate_distance(48.8566, 2.3522) - expected) < 1e-9
+
+    def test_kernels_compiled_once(self):
+        """Test numba kernels are compiled up front and not re-specialized."""
+        import src.geo_filter as geo_filter_module
+        if not geo_filter_module.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+
+        geo_filter = GeoFilter(latitude=0, longitude=0)
+        geo_filter_module.warm_up_kernels()
+        assert geo_filter_module._kernels_warm
+        geo_filter.calculate_distance(1, 1)  # int arguments
+
+        assert len(geo_filter_module._haversine_km.signatures) == 1
+        assert len(geo_filter_module._overhead_kernel.signatures) == 1
+
+    def test_fast_distance_matches_haversine_within_zone(self):
+        """Test the equirectangular approximation stays close to Haversine."""
+        geo_filter = GeoFilter(latitude=-37.7964, longitude=144.9008)
+        offsets = [(0.02, 0.0), (0.0, 0.03), (-0.02, 0.025), (0.06, -0.08)]
+
+        for dlat, dlon in offsets:
+            lat, lon = -37.7964 + dlat, 144.9008 + dlon
+            exact = geo_filter.calculate_distance(lat, lon)
+            assert abs(geo_filter._fast_distance_km_sq(lat, lon) ** 0.5 - exact) < 5e-3
+            fast_sq = geo_filter._fast_distances_km_sq(np.array([lat]), np.array([lon]))
+            assert abs(np.sqrt(fast_sq[0]) - exact) < 5e-3
+
     def test_is_overhead_within_radius(self):
         """Test aircraft within radius is considered overhead."""
         geo_filter = GeoFilter(
@@ -142,6 +192,18 @@ class TestGeoFilter:
 
         assert geo_filter.is_overhead(aircraft) is False
 
+    def test_distance_sq_if_overhead(self):
+        """Test the overhead check returns the squared distance only for overhead aircraft."""
+        geo_filter = GeoFilter(latitude=51.5074, longitude=-0.1278, radius_km=3.0)
+
+        overhead = Aircraft('abc123', {'lat': 51.51, 'lon': -0.13, 'alt_baro': 5000})
+        distance_sq = geo_filter._distance_sq_if_overhead(overhead)
+        assert distance_sq is not None
+        assert abs(distance_sq ** 0.5 - geo_filter.calculate_distance(51.51, -0.13)) < 1e-3
+
+        low = Aircraft('def456', {'lat': 51.51, 'lon': -0.13, 'alt_baro': 100})
+        assert geo_filter._distance_sq_if_overhead(low) is None
+
     def test_feet_to_meters_conversion(self):
         """Test conversion from feet to meters."""
         geo_filter = GeoFilter(latitude=0, longitude=0)
@@ -203,3 +265,105 @@ class TestGeoFilter:
         assert overhead[0].icao == 'NEAR'  # Closest first
         assert overhead[1].icao == 'MID'
         assert overhead[2].icao == 'FAR'
+
+    def test_filter_overhead_aircraft_missing_position(self):
+        """Test aircraft without position or altitude are skipped by the filter."""
+        geo_filter = GeoFilter(
+            latitude=51.5074,
+            longitude=-0.1278,
+            radius_km=5.0,
+            min_altitude_m=500,
+            max_altitude_m=None
+        )
+
+        aircraft_list = [
+            Aircraft(icao='NOPOS', data={'alt_baro': 3000}),
+            Aircraft(icao='NOALT', data={'lat': 51.51, 'lon': -0.13}),
+            Aircraft(icao='OK', data={'lat': 51.51, 'lon': -0.13, 'alt_baro': 45000}),
+        ]
+
+        overhead = geo_filter.filter_overhead_aircraft(aircraft_list)
+
+        assert [a.icao for a in overhead] == ['OK']
+        assert geo_filter.filter_overhead_aircraft([]) == []
+
+    def test_filter_overhead_batch(self):
+        """Test filtering a raw-record batch materializes only overhead aircraft."""
+        geo_filter = GeoFilter(
+            latitude=51.5074,
+            longitude=-0.1278,
+            radius_km=10.0,
+            min_altitude_m=500,
+            max_altitude_m=12000
+        )
+
+        batch = AircraftBatch.from_records([
+            {'hex': 'FAR', 'lat': 51.55, 'lon': -0.15, 'alt_baro': 3000},
+            {'hex': 'GND', 'lat': 51.51, 'lon': -0.13, 'alt_baro': 'ground'},
+            {'hex': 'NEAR', 'lat': 51.51, 'lon': -0.13, 'alt_baro': 3000},
+        ])
+
+        overhead = geo_filter.filter_overhead_batch(batch)
+
+        assert [a.icao for a in overhead] == ['NEAR', 'FAR']
+        assert isinstance(overhead[0], Aircraft)
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_filter_overhead_batch_matches_scalar_filter(self, monkeypatch, use_numba):
+        """Test the numba and NumPy batch paths agree with the scalar list filter."""
+        import src.geo_filter as geo_filter_module
+        if use_numba and not geo_filter_module.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(geo_filter_module, 'NUMBA_AVAILABLE', use_numba)
+
+        geo_filter = GeoFilter(
+            latitude=51.5074,
+            longitude=-0.1278,
+            radius_km=10.0,
+            min_altitude_m=500,
+            max_altitude_m=12000
+        )
+
+        rng = np.random.default_rng(7)
+        records = [
+            {
+                'hex': f'AC{i:03d}',
+                'lat': 51.5074 + float(rng.uniform(-0.2, 0.2)),
+                'lon': -0.1278 + float(rng.uniform(-0.3, 0.3)),
+                'alt_baro': int(rng.integers(0, 45000)),
+            }
+            for i in range(200)
+        ]
+        records.append({'hex': 'NOPOS', 'alt_baro': 5000})
+        records.append({'hex': 'GND', 'lat': 51.5074, 'lon': -0.1278, 'alt_baro': 'ground'})
+
+        expected = geo_filter.filter_overhead_aircraft(
+            [Aircraft(r['hex'], r) for r in records]
+        )
+        overhead = geo_filter.filter_overhead_batch(AircraftBatch.from_records(records))
+
+        assert len(expected) > 1
+        assert [a.icao for a in overhead] == [a.icao for a in expected]
+
+    @pytest.mark.parametrize('use_numba', [True, False])
+    def test_overhead_across_antimeridian(self, monkeypatch, use_numba):
+        """Test aircraft just across the +/-180 degree line count as overhead."""
+        import src.geo_filter as geo_filter_module
+        if use_numba and not geo_filter_module.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(geo_filter_module, 'NUMBA_AVAILABLE', use_numba)
+
+        geo_filter = GeoFilter(latitude=-16.8, longitude=179.99, radius_km=5.0)
+        records = [
+            {'hex': 'WEST', 'lat': -16.8, 'lon': -179.99, 'alt_baro': 5000},
+            {'hex': 'EAST', 'lat': -16.8, 'lon': 179.995, 'alt_baro': 5000},
+        ]
+        aircraft = Aircraft('WEST', records[0])
+
+        assert geo_filter.calculate_distance(-16.8, -179.99) < 5.0
+        assert abs(geo_filter._fast_distance_km_sq(-16.8, -179.99) ** 0.5 -
+                   geo_filter.calculate_distance(-16.8, -179.99)) < 5e-3
+        assert geo_filter.is_overhead(aircraft)
+
+        overhead = geo_filter.filter_overhead_batch(AircraftBatch.from_records(records))
+        assert [a.icao for a in overhead] == ['EAST', 'WEST']
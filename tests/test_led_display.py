@@ -28,6 +28,12 @@ class TestLEDDisplay:
         assert display.enabled is True
         assert display.rotation_seconds == 8
 
+        options = mock_options.return_value
+        assert options.rows == 32
+        assert options.cols == 64
+        assert options.brightness == 80
+        assert options.chain_length == 1  # Default when not configured
+
     def test_init_with_disabled_display(self):
         """Test initialization with display disabled."""
         config = {
@@ -101,6 +107,19 @@ class TestLEDDisplay:
         # Should not raise exception
         display.show_flight(aircraft)
 
+    def test_show_flight_uses_cached_display_text(self, capsys):
+        """Test show_flight prefers text cached on the aircraft."""
+        display = LEDDisplay({'enabled': False})
+
+        aircraft = Aircraft('abc123', {'flight': 'TEST123'})
+        aircraft.display_text = 'CACHED\nUK -> USA'
+
+        with patch.object(display, 'format_flight_info') as mock_format:
+            display.show_flight(aircraft)
+            mock_format.assert_not_called()
+
+        assert 'CACHED' in capsys.readouterr().out
+
     @patch('src.led_display.RGBMatrix')
     @patch('src.led_display.RGBMatrixOptions')
     def test_show_flight_enabled(self, mock_options, mock_matrix):
@@ -130,6 +149,30 @@ class TestLEDDisplay:
         # Verify matrix operations were called
         assert mock_matrix_instance.Clear.called or True  # Mock may not have Clear
 
+    @patch('src.led_display.graphics')
+    @patch('src.led_display.RGBMatrix')
+    @patch('src.led_display.RGBMatrixOptions')
+    def test_show_flight_reuses_canvas(self, mock_options, mock_matrix, mock_graphics):
+        """Test frames are drawn offscreen and swapped without clearing the matrix."""
+        config = {'enabled': True}
+
+        mock_matrix_instance = MagicMock()
+        mock_matrix.return_value = mock_matrix_instance
+        swapped_canvas = MagicMock()
+        mock_matrix_instance.SwapOnVSync.return_value = swapped_canvas
+
+        display = LEDDisplay(config)
+        display.font = MagicMock()
+
+        aircraft = Aircraft('abc123', {'flight': 'TEST123'})
+        display.show_flight(aircraft)
+        display.show_waiting_message()
+
+        mock_matrix_instance.Clear.assert_not_called()
+        mock_matrix_instance.CreateFrameCanvas.assert_called_once()
+        mock_matrix_instance.SwapOnVSync.assert_called_with(swapped_canvas)
+        swapped_canvas.Clear.assert_called_once()
+
     def test_show_waiting_message_disabled(self):
         """Test showing waiting message when display is disabled."""
         config = {'enabled': False}
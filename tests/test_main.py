@@ -0,0 +1,109 @@
+"""
+Tests for main application module.
+"""
+import threading
+from unittest.mock import MagicMock, Mock, patch
+import pytest
+from src.main import FlightTracker
+from src.utils import Aircraft
+
+
+def _overhead(*icaos):
+    """Build fresh Aircraft objects, as filter_overhead_batch does each tick."""
+    return [
+        Aircraft(icao, {'lat': -37.7964, 'lon': 144.9008, 'alt_baro': 5000})
+        for icao in icaos
+    ]
+
+
+@pytest.fixture
+def tracker():
+    """FlightTracker with mocked components, bypassing config loading."""
+    tracker = FlightTracker.__new__(FlightTracker)
+    tracker.logger = Mock()
+    tracker.adsb_processor = Mock()
+    tracker.adsb_processor.fetch_aircraft_batch.return_value = []
+    tracker.geo_filter = Mock()
+    tracker.flight_api = Mock()
+    tracker.led_display = Mock()
+    tracker.led_display.format_flight_info.side_effect = (
+        lambda aircraft: f"{aircraft.icao} text"
+    )
+    tracker._stop_event = threading.Event()
+    tracker._display_wake = threading.Event()
+    tracker._queue_lock = threading.Lock()
+    return tracker
+
+
+class TestFlightTracker:
+    """Test suite for FlightTracker class."""
+
+    def test_fetch_loop_ticks(self, tracker):
+        """Test enrichment, display text carry-over, queue updates and wake-ups."""
+        ticks = [_overhead('AAA', 'BBB'),
+                 _overhead('AAA', 'BBB', 'CCC'),
+                 _overhead('AAA', 'BBB', 'CCC')]
+        wake_at_tick = []
+
+        def filter_tick(batch):
+            tick = len(wake_at_tick)
+            wake_at_tick.append(tracker._display_wake.is_set())
+            tracker._display_wake.clear()
+            if tick == len(ticks) - 1:
+                tracker._stop_event.set()
+            return ticks[tick]
+
+        tracker.geo_filter.filter_overhead_batch.side_effect = filter_tick
+        tracker._fetch_loop(0)
+
+        # Only aircraft not overhead on the previous tick are enriched
+        enriched = [[a.icao for a in call.args[0]]
+                    for call in tracker.flight_api.enrich_multiple_aircraft.call_args_list]
+        assert enriched == [['AAA', 'BBB'], ['CCC'], []]
+        assert tracker.led_display.format_flight_info.call_count == 3
+
+        # Cached text is carried to the next tick's objects
+        for aircraft in ticks[2]:
+            assert aircraft.display_text == f"{aircraft.icao} text"
+
+        # The queue is replaced only when the overhead set changes
+        queued = [[a.icao for a in call.args[0]]
+                  for call in tracker.led_display.update_queue.call_args_list]
+        assert queued == [['AAA', 'BBB'], ['AAA', 'BBB', 'CCC']]
+
+        # The display is woken only when the queue goes from empty to non-empty
+        assert wake_at_tick == [False, True, False]
+        assert not tracker._display_wake.is_set()
+
+    def test_fetch_loop_clears_queue_when_overhead_empties(self, tracker):
+        """Test the queue is emptied and the display woken once aircraft leave."""
+        ticks = [_overhead('AAA'), [], []]
+        calls = []
+
+        def filter_tick(batch):
+            tick = len(calls)
+            calls.append(tick)
+            if tick == len(ticks) - 1:
+                tracker._stop_event.set()
+            return ticks[tick]
+
+        tracker.geo_filter.filter_overhead_batch.side_effect = filter_tick
+        tracker._fetch_loop(0)
+
+        queued = [[a.icao for a in call.args[0]]
+                  for call in tracker.led_display.update_queue.call_args_list]
+        assert queued == [['AAA'], []]
+        assert tracker._display_wake.is_set()
+
+    def test_init_components_warms_up_kernels(self):
+        """Test the batch filter kernel is compiled when components are built."""
+        tracker = FlightTracker.__new__(FlightTracker)
+        tracker.logger = Mock()
+        tracker.config = MagicMock()
+
+        with patch('src.main.ADSBProcessor'), patch('src.main.GeoFilter'), \
+                patch('src.main.FlightAPIClient'), patch('src.main.LEDDisplay'), \
+                patch('src.main.warm_up_kernels') as warm_up:
+            tracker._init_components()
+
+        warm_up.assert_called_once_with()
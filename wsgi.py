@@ -3,19 +3,37 @@ WSGI entry point for deployment platforms.
 """
 import os
 import sys
+from functools import lru_cache
 
 # Add the project root to the path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from src.dashboard import FlightTrackerDashboard
 
-# Create dashboard instance
-try:
+
+@lru_cache(maxsize=1)
+def _get_dashboard() -> FlightTrackerDashboard:
+    """
+    Build the dashboard once per process.
+
+    Entry points that import this module (wsgi, api/index.py) and warm
+    serverless invocations all share the same instance.
+
+    Returns:
+        The process-wide dashboard
+    """
     dashboard = FlightTrackerDashboard('config.yaml')
+    _configure(dashboard)
+    return dashboard
+
 
-    # Get the Flask app
-    app = dashboard.app
+def _configure(dashboard: FlightTrackerDashboard) -> None:
+    """
+    Apply environment-driven runtime setup to a newly built dashboard.
 
+    Args:
+        dashboard: Dashboard to configure
+    """
     # Start background updates when in demo mode (not for Vercel serverless)
     if os.environ.get('DEMO_MODE') == 'true':
         print("Running in DEMO mode - using simulated data")
@@ -23,24 +41,54 @@ try:
         if os.environ.get('VERCEL') != '1':
             dashboard.start_background_updates(interval=5)
 
-except Exception as e:
-    print(f"Error initializing dashboard: {e}")
+
+def _error_app(error: Exception):
+    """
+    Build a minimal Flask app that reports a failed dashboard start.
+
+    Only imported and built on the failure path.
+
+    Args:
+        error: Exception raised while building the dashboard
+
+    Returns:
+        Flask app serving the error on /
+    """
     import traceback
     traceback.print_exc()
 
-    # Create a minimal Flask app for error display
     from flask import Flask, jsonify
-    app = Flask(__name__)
+    error_app = Flask(__name__)
+    message = str(error)
 
-    @app.route('/')
-    def error():
+    @error_app.route('/')
+    def error_page():
         return jsonify({
             'error': 'Dashboard initialization failed',
-            'message': str(e),
+            'message': message,
             'demo_mode': os.environ.get('DEMO_MODE'),
             'vercel': os.environ.get('VERCEL')
         }), 500
 
+    return error_app
+
+
+def _make_app():
+    """
+    Build the WSGI app, falling back to an error app if startup fails.
+
+    Returns:
+        Dashboard Flask app, or the error app
+    """
+    try:
+        return _get_dashboard().app
+    except Exception as e:
+        print(f"Error initializing dashboard: {e}")
+        return _error_app(e)
+
+
+app = _make_app()
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port)